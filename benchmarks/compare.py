@@ -0,0 +1,39 @@
+"""
+Compares two benchmark reports written by run.py:
+
+    python benchmarks/compare.py before.json after.json
+"""
+import json
+import sys
+
+
+def key(result):
+    return (result["workbook_rows"], result["width"], result["variant"], result["mode"])
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        print(__doc__.strip(), file=sys.stderr)
+        return 2
+
+    with open(argv[0]) as fp:
+        before = {key(result): result for result in json.load(fp)["results"]}
+    with open(argv[1]) as fp:
+        after = {key(result): result for result in json.load(fp)["results"]}
+
+    for scenario in sorted(before.keys() & after.keys()):
+        old = before[scenario]["load_seconds"]
+        new = after[scenario]["load_seconds"]
+        change = (new - old) / old * 100 if old else 0.0
+        rows, width, variant, mode = scenario
+        print(
+            f"{rows:>8} {width:<6} {variant:<10} {mode:<9}"
+            f" {old:8.3f}s → {new:8.3f}s ({change:+6.1f} %)"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""
+Runs benchmarks against synthetic workbooks and writes the results as JSON,
+so they can be compared across commits:
+
+    python benchmarks/run.py --rows 10000 100000 --output results.json
+    python benchmarks/compare.py before.json after.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from workbooks import VARIANTS, BenchmarkSheet, generate  # noqa: E402
+
+from superspreader.readers import XLSXReader  # noqa: E402
+from superspreader.stats import LoadStats  # noqa: E402
+
+
+def load(path, trace_memory=False, reader_class=None, **load_kwargs):
+    sheet = BenchmarkSheet(path)
+    if reader_class is not None:
+        sheet.reader_class = reader_class
+    stats = LoadStats(trace_memory=trace_memory)
+    started_at = time.perf_counter()
+    sheet.load(stats=stats, **load_kwargs)
+    return sheet, stats, time.perf_counter() - started_at
+
+
+def benchmark(path, mode, load_kwargs, repeat, trace_memory=True):
+    """
+    Times a load and copying its rows into dicts, as views are created lazily.
+    Memory is traced in a separate run, as tracing slows loading down.
+    """
+    timings = []
+    for _ in range(repeat):
+        sheet, stats, seconds = load(path, **load_kwargs)
+
+        started_at = time.perf_counter()
+        sheet.rows(copy=True)
+        rows_seconds = time.perf_counter() - started_at
+
+        timings.append((seconds, rows_seconds, stats))
+
+    seconds, rows_seconds, stats = min(timings, key=lambda timing: timing[0])
+
+    peak_memory = None
+    if trace_memory:
+        _sheet, memory_stats, _seconds = load(path, trace_memory=True, **load_kwargs)
+        peak_memory = memory_stats.peak_memory
+
+    return {
+        "mode": mode,
+        "load_seconds": seconds,
+        "rows_seconds": rows_seconds,
+        "unique_seconds": stats.phases.get("unique", 0.0),
+        "rows_per_second": stats.rows / seconds if seconds else None,
+        "peak_memory": peak_memory,
+        "rows": len(sheet),
+        "errors": len(sheet.errors),
+        "phases": stats.phases,
+    }
+
+
+MODES = {
+    "default": {},
+    "read_only": {"read_only": True},
+    "columnar": {"columnar": True},
+    "native": {"reader_class": XLSXReader},
+}
+
+
+def git_revision():
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[10000], help="Data rows per workbook"
+    )
+    parser.add_argument("--variants", nargs="+", choices=VARIANTS, default=VARIANTS)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument(
+        "--widths", nargs="+", choices=("narrow", "wide"), default=["narrow", "wide"]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Don’t trace peak memory, which takes an extra, slow run",
+    )
+    parser.add_argument(
+        "--directory",
+        default=os.path.join(tempfile.gettempdir(), "superspreader-benchmarks"),
+        help="Where generated workbooks are kept between runs",
+    )
+    parser.add_argument("--output", help="Write JSON results to this file")
+    args = parser.parse_args(argv)
+
+    results = []
+
+    for rows in args.rows:
+        for width in args.widths:
+            for variant in args.variants:
+                path = generate(
+                    args.directory, rows, wide=width == "wide", variant=variant
+                )
+                for mode in args.modes:
+                    result = benchmark(
+                        path,
+                        mode,
+                        MODES[mode],
+                        args.repeat,
+                        trace_memory=not args.no_memory,
+                    )
+                    result.update(
+                        {"workbook_rows": rows, "width": width, "variant": variant}
+                    )
+                    results.append(result)
+                    memory = ""
+                    if result["peak_memory"] is not None:
+                        memory = f" {result['peak_memory'] / 1024 / 1024:8.1f} MiB"
+                    print(
+                        f"{rows:>8} {width:<6} {variant:<10} {mode:<9}"
+                        f" {result['load_seconds']:8.3f}s{memory}",
+                        file=sys.stderr,
+                    )
+
+    report = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(report, fp, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Generates synthetic workbooks for benchmarks
+"""
+import datetime
+import os
+import random
+
+from openpyxl import Workbook
+
+from superspreader import fields
+from superspreader.sheets import BaseSheet
+
+SHEET_NAME = "Benchmark"
+
+COLUMNS = (
+    "ID",
+    "Name",
+    "Quantity",
+    "Price",
+    "Delivery Date",
+    "Ordered At",
+    "Duration",
+)
+
+# Columns without fields, added to wide workbooks
+FILLER_COLUMNS = 60
+
+VARIANTS = ("clean", "errors", "duplicates", "blank_rows")
+
+
+class BenchmarkSheet(BaseSheet):
+    sheet_name = SHEET_NAME
+
+    id = fields.IntegerField(source="ID", unique=True)
+    name = fields.CharField(source="Name")
+    quantity = fields.IntegerField(source="Quantity")
+    price = fields.FloatField(source="Price")
+    delivery_date = fields.DateField(source="Delivery Date")
+    ordered_at = fields.DateTimeField(source="Ordered At")
+    duration = fields.TimecodeField(source="Duration", required=False)
+
+
+def workbook_name(rows, wide, variant):
+    width = "wide" if wide else "narrow"
+    return f"benchmark_{rows}_{width}_{variant}.xlsx"
+
+
+def generate(directory, rows, wide=False, variant="clean", seed=0):
+    """
+    Writes a workbook, unless it exists already
+
+    :param directory: The directory to write to
+    :param int rows: The number of data rows
+    :param bool wide: Add columns that aren’t used by any field
+    :param str variant: One of `VARIANTS`
+    :return: The workbook’s path
+    """
+    if variant not in VARIANTS:
+        raise ValueError(f"Unknown variant {variant}")
+
+    path = os.path.join(directory, workbook_name(rows, wide, variant))
+    if os.path.exists(path):
+        return path
+
+    os.makedirs(directory, exist_ok=True)
+    random.seed(seed)
+
+    fillers = FILLER_COLUMNS if wide else 0
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(SHEET_NAME)
+    ws.append(list(COLUMNS) + [f"Filler {index}" for index in range(fillers)])
+
+    start = datetime.datetime(2022, 1, 1)
+
+    for index in range(rows):
+        if variant == "blank_rows" and index % 10 == 9:
+            ws.append([])
+            continue
+
+        row_id = index
+        if variant == "duplicates" and index % 100 == 0:
+            row_id = 0
+
+        ordered_at = start + datetime.timedelta(minutes=index)
+        row = [
+            row_id,
+            f"Customer {random.randint(0, 9999)}",
+            random.randint(1, 100),
+            round(random.uniform(1, 1000), 2),
+            ordered_at + datetime.timedelta(days=3),
+            ordered_at,
+            f"00:{index % 60:02d}:{index % 60:02d},{index % 10}",
+        ]
+
+        if variant == "errors" and index % 20 == 0:
+            row[2] = "many"
+
+        ws.append(row + [index] * fillers)
+
+    wb.save(path)
+    return path
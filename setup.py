@@ -29,10 +29,14 @@ setup(
     package_dir={"": "src"},
     packages=find_packages(where="src"),
     python_requires=">=3.6, <4",
+    entry_points={
+        "console_scripts": ["superspreader=superspreader.cli:main"],
+    },
     install_requires=["openpyxl>=3"],
     extras_require={
         "dev": ["pre-commit"],
         "test": ["coverage"],
+        "parquet": ["pyarrow"],
     },
     project_urls={
         "Source": "https://github.com/julianklotz/superspreader",
@@ -0,0 +1,44 @@
+import inspect
+
+# asyncio is imported by the functions, as it’s only needed for async loads
+# and lookups, and slow to import
+
+
+async def gather(values, limit=None) -> list:
+    """
+    Awaits awaitables concurrently and returns all results in order. Values
+    that aren’t awaitable are returned as they are.
+
+    :param values: An iterable of awaitables and other values
+    :param int limit: The maximum number of awaitables in flight, unbounded when `None`
+    :return: A list of results
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(limit) if limit else None
+
+    async def resolve(value):
+        if not inspect.isawaitable(value):
+            return value
+        if semaphore is None:
+            return await value
+        async with semaphore:
+            return await value
+
+    return await asyncio.gather(*(resolve(value) for value in values))
+
+
+def run(values, loop=None, limit=None) -> list:
+    """
+    Resolves awaitables from synchronous code, see `gather`.
+
+    :param loop: A running event loop in another thread to run them on.
+                 A new event loop is used when `None`.
+    """
+    import asyncio
+
+    coro = gather(values, limit=limit)
+
+    if loop is None:
+        return asyncio.run(coro)
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
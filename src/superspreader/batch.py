@@ -0,0 +1,135 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from .i18n import EN
+
+
+class SheetResult:
+    """
+    The outcome of loading a single sheet in a batch. Results only hold plain
+    data, so they can be passed between processes.
+    """
+
+    def __init__(
+        self, sheet_class, path, rows=None, errors=None, infos=None, exception=None
+    ):
+        """
+        :param sheet_class: The sheet class that was loaded
+        :param path: The document’s path
+        :param list rows: The row dicts
+        :param list errors: The sheet’s errors
+        :param list infos: The sheet’s infos
+        :param str exception: Describes the exception that aborted loading
+        """
+        self.sheet_class = sheet_class
+        self.path = path
+        self.rows = rows if rows is not None else []
+        self.errors = errors if errors is not None else []
+        self.infos = infos if infos is not None else []
+        self.exception = exception
+
+    @property
+    def failed(self):
+        return self.exception is not None
+
+    @property
+    def has_errors(self):
+        return self.failed or len(self.errors) > 0
+
+    def __repr__(self):
+        return f"<SheetResult {self.sheet_class.__name__} {self.path}>"
+
+
+def load_sheet(
+    sheet_class,
+    path,
+    language=EN,
+    extra_data=None,
+    keep_rows=True,
+    sample_size=None,
+    **load_kwargs,
+):
+    """
+    Loads a single sheet and wraps its outcome in a `SheetResult`. Exceptions
+    are caught and recorded on the result.
+
+    :param keep_rows: Add the rows to the result. Pass `False` if only errors
+                      are of interest, so rows aren’t passed between processes.
+    :param int sample_size: Only validate a sample of rows, see `BaseSheet.validate`
+    :param load_kwargs: Passed to `BaseSheet.load`, or to `BaseSheet.validate`
+                        if there’s a sample size
+    :return: SheetResult
+    """
+    try:
+        sheet = sheet_class(path, language=language, extra_data=extra_data)
+        if sample_size is not None:
+            sheet.validate(sample_size=sample_size, **load_kwargs)
+        else:
+            sheet.load(**load_kwargs)
+    except Exception as exc:
+        return SheetResult(sheet_class, path, exception=_describe(exc))
+
+    return SheetResult(
+        sheet_class,
+        path,
+        rows=sheet.rows(copy=True) if keep_rows and sample_size is None else None,
+        errors=sheet.errors,
+        infos=sheet.infos,
+    )
+
+
+def load_many(
+    jobs,
+    max_workers=None,
+    language=EN,
+    extra_data=None,
+    executor_class=None,
+    **load_kwargs,
+):
+    """
+    Loads many sheets in parallel, using a process pool by default.
+    A failing document doesn’t affect the others.
+
+    Sheet classes must be importable by the worker processes, i.e. be defined
+    at module level. The same applies to `extra_data` and `load_kwargs`,
+    which must be picklable.
+
+    :param jobs: Iterable of (sheet class, path) tuples
+    :param int max_workers: The number of workers, defaults to the number of CPUs
+    :param language: The language of errors and infos
+    :param extra_data: Passed to each sheet
+    :param executor_class: A `concurrent.futures.Executor` subclass,
+                           defaults to `ProcessPoolExecutor`
+    :param load_kwargs: Passed to `load_sheet`, e.g. `keep_rows` or `read_only`
+    :return: A list of `SheetResult` in the order of jobs
+    """
+    if executor_class is None:
+        executor_class = ProcessPoolExecutor
+
+    jobs = list(jobs)
+    results = []
+
+    with executor_class(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                load_sheet,
+                sheet_class,
+                path,
+                language=language,
+                extra_data=extra_data,
+                **load_kwargs,
+            )
+            for sheet_class, path in jobs
+        ]
+
+        for (sheet_class, path), future in zip(jobs, futures):
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                # E.g. a worker process died or the result couldn’t be pickled
+                results.append(SheetResult(sheet_class, path, exception=_describe(exc)))
+
+    return results
+
+
+def _describe(exc):
+    return f"{exc.__class__.__name__}: {exc}"
@@ -0,0 +1,135 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import zlib
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class ResultCache:
+    """
+    Stores the results of loading a sheet on disk, keyed by the document’s
+    content hash and the sheet’s configuration. Entries are compressed
+    pickles, so only point it to a directory you trust.
+
+    When the cache grows beyond `max_size` bytes, the least recently used
+    entries are evicted.
+
+    ```
+    class AlbumSheet(BaseSheet):
+        result_cache = ResultCache("/var/cache/superspreader")
+    ```
+    """
+
+    suffix = ".cache"
+
+    def __init__(self, directory, max_size=256 * 1024 * 1024):
+        """
+        :param directory: The directory to store entries in. It’s created if missing.
+        :param int max_size: The maximum size of all entries in bytes
+        """
+        self.directory = directory
+        self.max_size = max_size
+
+    def make_key(self, path, fingerprint) -> str:
+        """
+        :param path: The document’s path or a binary file object
+        :param str fingerprint: Describes the sheet’s configuration
+        :return: The key of the entry
+        """
+        digest = hashlib.sha256()
+
+        for chunk in _read_chunks(path):
+            digest.update(chunk)
+
+        digest.update(fingerprint.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        :return: The stored result, or `None` if there’s no entry
+        """
+        entry_path = self._entry_path(key)
+
+        try:
+            with open(entry_path, "rb") as fp:
+                data = fp.read()
+        except FileNotFoundError:
+            return None
+
+        try:
+            result = pickle.loads(zlib.decompress(data))
+        except (zlib.error, pickle.UnpicklingError, EOFError):
+            # Treat broken entries like missing ones
+            return None
+
+        # Mark as recently used
+        os.utime(entry_path)
+        return result
+
+    def set(self, key, result) -> None:
+        """
+        Stores a result and evicts old entries if the cache is full
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        data = zlib.compress(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+
+        # Write to a temporary file first, so readers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                fp.write(data)
+            os.replace(tmp_path, self._entry_path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used entries until the cache fits `max_size`
+        """
+        entries = []
+        total = 0
+
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith(self.suffix):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+
+        for _mtime, size, entry_path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.unlink(entry_path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(self.suffix):
+                os.unlink(entry.path)
+
+    def _entry_path(self, key):
+        return os.path.join(self.directory, key + self.suffix)
+
+
+def _read_chunks(path):
+    if hasattr(path, "read"):
+        position = path.tell()
+        try:
+            yield from iter(lambda: path.read(CHUNK_SIZE), b"")
+        finally:
+            path.seek(position)
+        return
+
+    with open(path, "rb") as fp:
+        yield from iter(lambda: fp.read(CHUNK_SIZE), b"")
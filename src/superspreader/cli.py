@@ -0,0 +1,229 @@
+import argparse
+import glob
+import importlib
+import json
+import os
+import sys
+
+EXIT_OK = 0
+# At least one document has errors
+EXIT_INVALID = 1
+# Wrong arguments, e.g. a sheet class that can’t be imported
+EXIT_USAGE = 2
+# At least one document couldn’t be processed
+EXIT_FAILED = 3
+
+
+def main(argv=None) -> int:
+    """
+    The entry point of the `superspreader` command, which validates documents
+    against a sheet class and prints one JSON object per document:
+
+    ```
+    superspreader myapp.sheets:AlbumSheet "uploads/*.xlsx" --workers 4
+    ```
+
+    Heavy dependencies like openpyxl are imported once documents are read,
+    so `--help` and usage errors are quick.
+
+    :param argv: The arguments, defaults to `sys.argv[1:]`
+    :return: The exit code
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        sheet_class = import_sheet_class(args.sheet)
+    except (ImportError, AttributeError, ValueError) as exc:
+        parser.exit(EXIT_USAGE, f"{parser.prog}: error: {exc}\n")
+
+    paths = expand_paths(args.paths)
+    if not paths:
+        parser.exit(EXIT_USAGE, f"{parser.prog}: error: no documents found\n")
+
+    # Imported here, as it imports the rest of superspreader
+    from .batch import load_many
+
+    load_kwargs = {"keep_rows": False}
+    if args.sample is not None:
+        load_kwargs["sample_size"] = args.sample
+    if args.read_only:
+        load_kwargs["read_only"] = True
+
+    executor_class = None
+    if args.workers == 1:
+        executor_class = _InlineExecutor
+
+    results = load_many(
+        [(sheet_class, path) for path in paths],
+        max_workers=args.workers,
+        language=args.language,
+        executor_class=executor_class,
+        **load_kwargs,
+    )
+    entries = [_describe_result(result) for result in results]
+
+    if args.format == "json":
+        json.dump(
+            {"valid": all(entry["valid"] for entry in entries), "results": entries},
+            sys.stdout,
+            ensure_ascii=False,
+            indent=2,
+        )
+        sys.stdout.write("\n")
+    else:
+        for entry in entries:
+            sys.stdout.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    if any(result.failed for result in results):
+        return EXIT_FAILED
+    if any(result.has_errors for result in results):
+        return EXIT_INVALID
+    return EXIT_OK
+
+
+def import_sheet_class(spec):
+    """
+    :param str spec: The sheet class as `module:SheetClass`
+    :return: The sheet class
+    """
+    module_name, _sep, qualname = spec.partition(":")
+    if not module_name or not qualname:
+        raise ValueError(f"expected module:SheetClass, got “{spec}”")
+
+    # Like `python -m`, import modules from the working directory
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+
+    obj = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def expand_paths(patterns) -> list:
+    """
+    Expands glob patterns. Paths without matches are kept, so that missing
+    documents are reported.
+
+    :param patterns: Paths and glob patterns
+    :return: A list of paths without duplicates
+    """
+    paths = []
+
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True))
+        if matches:
+            paths.extend(matches)
+        elif not glob.has_magic(pattern):
+            paths.append(pattern)
+
+    return list(dict.fromkeys(paths))
+
+
+def _build_parser():
+    parser = argparse.ArgumentParser(
+        prog="superspreader",
+        description="Validates documents against a sheet class and prints the results as JSON.",
+        epilog="Exit codes: 0 if all documents are valid, 1 if a document has errors,"
+        " 2 on usage errors and 3 if a document couldn’t be processed.",
+    )
+    parser.add_argument("sheet", help="The sheet class, e.g. myapp.sheets:AlbumSheet")
+    parser.add_argument(
+        "paths", nargs="+", help="Documents to validate, glob patterns are expanded"
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=_positive_int,
+        default=None,
+        help="The number of worker processes, defaults to the number of CPUs."
+        " 1 validates documents in this process.",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=("ndjson", "json"),
+        default="ndjson",
+        help="One JSON object per document (default) or a single JSON document",
+    )
+    parser.add_argument(
+        "-s",
+        "--sample",
+        type=_non_negative_int,
+        default=None,
+        metavar="ROWS",
+        help="Only validate the first rows instead of loading whole documents."
+        " 0 only checks whether the sheet and its columns are present.",
+    )
+    parser.add_argument(
+        "--read-only",
+        action="store_true",
+        help="Stream Excel documents with openpyxl’s read-only mode",
+    )
+    parser.add_argument(
+        "-l", "--language", default="en", help="The language of errors, e.g. en or de"
+    )
+    return parser
+
+
+def _positive_int(value) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive number, got “{value}”")
+    return number
+
+
+def _non_negative_int(value) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        raise argparse.ArgumentTypeError(
+            f"expected zero or a positive number, got “{value}”"
+        )
+    return number
+
+
+def _describe_result(result) -> dict:
+    return {
+        "path": os.fspath(result.path),
+        "valid": not result.has_errors,
+        "errors": result.errors,
+        "infos": result.infos,
+        "exception": result.exception,
+    }
+
+
+class _InlineExecutor:
+    """
+    Runs jobs in the current process, in the interface of
+    `concurrent.futures.Executor` that `load_many` uses
+    """
+
+    def __init__(self, max_workers=None):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args, **kwargs):
+        from concurrent.futures import Future
+
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+from abc import ABC
+
+from .i18n import EN
+from .readers import load_workbook
+from .sheets import BaseSheet
+
+
+class BaseDocument(ABC):
+    """
+    Describes a document with several sheets. The document is opened once and
+    its workbook is shared by all sheets.
+
+    ```
+    class OrderDocument(BaseDocument):
+        orders = OrderSheet
+        lines = LineSheet
+
+    document = OrderDocument("orders.xlsx")
+    document.load()
+    document.orders.rows()
+    ```
+    """
+
+    read_only = False
+
+    def __init__(self, path, language=EN, extra_data=None):
+        """
+        :param path: The document’s path
+        :param language: The language of errors and infos
+        :param dict extra_data: Passed to each sheet
+        """
+        self.language = language
+        self.path = path
+        self._extra_data = extra_data
+        self._sheet_classes = self._build_sheet_classes()
+        self._sheets = {}
+
+    def load(self, extra_context=None, read_only=None):
+        """
+        Opens the document once and loads all sheets from it.
+
+        :param extra_context: A dictionary that is passed to the fields
+        :param read_only: Stream the workbook using openpyxl’s read-only mode.
+                          Defaults to the document’s `read_only` attribute.
+        """
+        if read_only is None:
+            read_only = self.read_only
+
+        wb = load_workbook(filename=self.path, read_only=read_only, data_only=True)
+        sheets = {}
+
+        try:
+            for name, sheet_class in self._sheet_classes.items():
+                sheet = sheet_class(
+                    self.path,
+                    language=self.language,
+                    extra_data=self._extra_data,
+                    workbook=wb,
+                )
+                sheet.load(extra_context)
+                sheets[name] = sheet
+        finally:
+            if read_only:
+                wb.close()
+
+        self._sheets = sheets
+
+        # Loaded sheets shadow the sheet classes declared on the document
+        for name, sheet in sheets.items():
+            setattr(self, name, sheet)
+
+    @property
+    def sheets(self):
+        """
+        :return: A dictionary that maps names to loaded sheets
+        """
+        return dict(self._sheets)
+
+    @property
+    def errors(self):
+        """
+        :return: A dictionary that maps names of sheets with errors to their errors
+        """
+        return {
+            name: sheet.errors
+            for name, sheet in self._sheets.items()
+            if sheet.has_errors
+        }
+
+    @property
+    def has_errors(self):
+        return any(sheet.has_errors for sheet in self._sheets.values())
+
+    #
+    # === Protected ===
+    #
+
+    def _build_sheet_classes(self) -> dict:
+        sheet_classes = {}
+
+        for base in reversed(self.__class__.mro()):
+            for attr, value in vars(base).items():
+                if isinstance(value, type) and issubclass(value, BaseSheet):
+                    sheet_classes[attr] = value
+
+        return sheet_classes
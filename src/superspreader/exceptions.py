@@ -15,7 +15,33 @@ class ImproperlyConfigured(BaseException):
 
 
 class ValidationException(BaseException):
-    pass
+    def __init__(self, msg=None, hint=None, code=None, params=None, language=None):
+        """
+        Takes either a message, or the code of a message in `messages` and its
+        params. Coded messages are only translated when they are read.
+
+        :param str code: The message code, e.g. "field.is_required"
+        :param dict params: The message params
+        :param language: The language to translate the message to
+        """
+        super().__init__(msg, hint)
+        self.code = code
+        self.params = params if params is not None else {}
+        self.language = language
+
+    @property
+    def msg(self):
+        if self._msg is None and self.code is not None:
+            from .i18n import default_language, translate
+
+            return translate(
+                self.code, self.language or default_language(), self.params
+            )
+        return self._msg
+
+    @msg.setter
+    def msg(self, value):
+        self._msg = value
 
 
 class TranslationMissing(BaseException):
@@ -0,0 +1,303 @@
+import csv
+import datetime
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+from decimal import Decimal
+from itertools import islice
+
+from .exceptions import ImproperlyConfigured
+
+SQLITE_TYPES = {
+    bool: "INTEGER",
+    int: "INTEGER",
+    float: "REAL",
+    str: "TEXT",
+    datetime.date: "TEXT",
+    datetime.datetime: "TEXT",
+}
+
+
+class BaseExporter(ABC):
+    """
+    Writes rows to another format. Rows are consumed in chunks of
+    `chunk_size`, so only one chunk is held in memory at a time.
+
+    ```
+    sheet.export(JSONLinesExporter("albums.jsonl"))
+    # Or, for loaded rows
+    JSONLinesExporter("albums.jsonl").export(sheet.rows(), types=sheet.get_target_types())
+    ```
+    """
+
+    chunk_size = 1000
+
+    def __init__(self, destination, chunk_size=None):
+        """
+        :param destination: A path or, depending on the exporter, a file object
+        :param int chunk_size: The number of rows written at once
+        """
+        self.destination = destination
+        if chunk_size is not None:
+            self.chunk_size = chunk_size
+
+    def export(self, rows, types=None) -> int:
+        """
+        :param rows: An iterable of row dicts, sharing the same keys
+        :param dict types: Maps keys to their type, e.g. a field’s `target_type`.
+                           Keys of the first row are exported, or the keys of
+                           `types` if there are no rows.
+        :return: The number of rows written
+        """
+        types = types or {}
+        rows = iter(rows)
+        names = None
+        total = 0
+
+        try:
+            while True:
+                chunk = list(islice(rows, self.chunk_size))
+
+                if names is None:
+                    keys = list(chunk[0]) if chunk else list(types)
+                    self.begin(keys, [types.get(key) for key in keys])
+                    names = keys
+                if not chunk:
+                    break
+
+                self.write_chunk(chunk)
+                total += len(chunk)
+        finally:
+            if names is not None:
+                self.finish()
+
+        return total
+
+    @abstractmethod
+    def begin(self, names, types) -> None:
+        """
+        Opens the destination
+
+        :param list names: The keys of the rows, in order
+        :param list types: The type of each key, `None` if unknown
+        """
+
+    @abstractmethod
+    def write_chunk(self, rows) -> None:
+        """
+        :param list rows: Row dicts
+        """
+
+    def finish(self) -> None:
+        """
+        Flushes and closes the destination
+        """
+
+
+class _TextExporter(BaseExporter):
+    """
+    Writes to a text file, which is opened if a path is passed
+    """
+
+    encoding = "utf-8"
+    newline = None
+
+    def __init__(self, destination, chunk_size=None):
+        super().__init__(destination, chunk_size=chunk_size)
+        self._fp = None
+        self._owns_fp = False
+
+    def begin(self, names, types) -> None:
+        self._names = names
+
+        if hasattr(self.destination, "write"):
+            self._fp = self.destination
+        else:
+            self._fp = open(
+                self.destination, "w", encoding=self.encoding, newline=self.newline
+            )
+            self._owns_fp = True
+
+    def finish(self) -> None:
+        if self._owns_fp:
+            self._fp.close()
+            self._owns_fp = False
+        self._fp = None
+
+
+class JSONLinesExporter(_TextExporter):
+    """
+    Writes one JSON object per row. Dates are written as ISO 8601 strings.
+    """
+
+    def write_chunk(self, rows) -> None:
+        names = self._names
+        lines = [
+            json.dumps(
+                {name: row.get(name) for name in names},
+                ensure_ascii=False,
+                default=_to_text,
+            )
+            for row in rows
+        ]
+        lines.append("")
+        self._fp.write("\n".join(lines))
+
+
+class CSVExporter(_TextExporter):
+    """
+    Writes rows with a header line. Dates are written as ISO 8601 strings,
+    `None` as empty cells.
+    """
+
+    delimiter = ","
+    newline = ""
+
+    def begin(self, names, types) -> None:
+        super().begin(names, types)
+        self._writer = csv.writer(self._fp, delimiter=self.delimiter)
+        self._writer.writerow(names)
+
+    def write_chunk(self, rows) -> None:
+        names = self._names
+        self._writer.writerows(
+            [_to_cell(row.get(name)) for name in names] for row in rows
+        )
+
+
+class SQLiteExporter(BaseExporter):
+    """
+    Inserts rows into a SQLite table, using one `executemany` per chunk. The
+    table is created if it doesn’t exist, typed by the keys’ types. Dates are
+    stored as ISO 8601 strings.
+    """
+
+    def __init__(self, destination, table, chunk_size=None):
+        """
+        :param destination: A path or a `sqlite3.Connection`
+        :param str table: The name of the table
+        """
+        super().__init__(destination, chunk_size=chunk_size)
+        self.table = table
+        self._connection = None
+        self._owns_connection = False
+
+    def begin(self, names, types) -> None:
+        if isinstance(self.destination, sqlite3.Connection):
+            self._connection = self.destination
+        else:
+            self._connection = sqlite3.connect(self.destination)
+            self._owns_connection = True
+
+        self._names = names
+        table = _quote(self.table)
+        columns = ", ".join(
+            f"{_quote(name)} {SQLITE_TYPES.get(type_, '')}".rstrip()
+            for name, type_ in zip(names, types)
+        )
+        self._connection.execute(f"CREATE TABLE IF NOT EXISTS {table} ({columns})")
+        self._insert = (
+            f"INSERT INTO {table} ({', '.join(_quote(name) for name in names)})"
+            f" VALUES ({', '.join('?' for _name in names)})"
+        )
+
+    def write_chunk(self, rows) -> None:
+        names = self._names
+        self._connection.executemany(
+            self._insert,
+            ([_to_sql(row.get(name)) for name in names] for row in rows),
+        )
+
+    def finish(self) -> None:
+        self._connection.commit()
+        if self._owns_connection:
+            self._connection.close()
+            self._owns_connection = False
+        self._connection = None
+
+
+class ParquetExporter(BaseExporter):
+    """
+    Writes a Parquet file using pyarrow, one row group per chunk. Keys
+    without a type are written as strings.
+    """
+
+    chunk_size = 64 * 1024
+
+    def begin(self, names, types) -> None:
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImproperlyConfigured(
+                "pyarrow is required for Parquet files", hint="pip install pyarrow"
+            )
+
+        arrow_types = {
+            bool: pyarrow.bool_(),
+            int: pyarrow.int64(),
+            float: pyarrow.float64(),
+            str: pyarrow.string(),
+            datetime.date: pyarrow.date32(),
+            datetime.datetime: pyarrow.timestamp("us"),
+        }
+
+        self._pyarrow = pyarrow
+        self._names = names
+        self._converters = [
+            None if type_ in arrow_types else _to_text for type_ in types
+        ]
+        self._schema = pyarrow.schema(
+            [
+                (name, arrow_types.get(type_, pyarrow.string()))
+                for name, type_ in zip(names, types)
+            ]
+        )
+        self._writer = pyarrow.parquet.ParquetWriter(self.destination, self._schema)
+
+    def write_chunk(self, rows) -> None:
+        columns = []
+
+        for name, convert in zip(self._names, self._converters):
+            column = [row.get(name) for row in rows]
+            if convert is not None:
+                column = [
+                    convert(value) if value is not None else None for value in column
+                ]
+            columns.append(column)
+
+        table = self._pyarrow.Table.from_arrays(
+            [
+                self._pyarrow.array(column, type=field.type)
+                for column, field in zip(columns, self._schema)
+            ],
+            schema=self._schema,
+        )
+        self._writer.write_table(table)
+
+    def finish(self) -> None:
+        self._writer.close()
+
+
+def _quote(identifier):
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _to_text(value):
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return str(value)
+
+
+def _to_cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, (datetime.date, datetime.time, Decimal)):
+        return _to_text(value)
+    return value
+
+
+def _to_sql(value):
+    if value is None or isinstance(value, (int, float, str, bytes)):
+        return value
+    return _to_text(value)
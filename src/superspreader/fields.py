@@ -1,15 +1,96 @@
+import array
 import datetime
+import functools
+import inspect
 import re
+import warnings
 from abc import ABC
 
+from . import aio
 from .exceptions import ImproperlyConfigured, ValidationException
-from .i18n import translate as _
+from .i18n import default_language
+from .readers import WINDOWS_EPOCH, _from_excel
+
+# Serial number of 9999-12-31
+EXCEL_MAX_SERIAL = 2958466
+
+TIMECODE_PATTERN = re.compile(r"^(\d+):(\d{1,2}):(\d{1,2})(?:[-,.](\d+))?$")
+
+
+class FieldContext:
+    """
+    Describes the load a value is cleaned for. It’s passed to fields
+    explicitly, so fields don’t keep any state and can be shared between
+    threads.
+    """
+
+    def __init__(
+        self, language=None, extra_context=None, loop=None, max_concurrency=None
+    ):
+        """
+        :param language: The language of validation messages
+        :param dict extra_context: The extra context passed to `BaseSheet.load`
+        :param loop: The event loop of `BaseSheet.aload`, see `resolve`
+        :param int max_concurrency: The maximum number of awaitables in flight
+        """
+        self.language = language if language is not None else default_language()
+        self.extra_context = extra_context if extra_context is not None else {}
+        self.loop = loop
+        self.max_concurrency = max_concurrency
+        # Fields may keep data here for the duration of a load, see `prepare`
+        self.cache = {}
+
+    def get_cache(self, field) -> dict:
+        """
+        :return: The cache of a field
+        """
+        return self.cache.setdefault(field, {})
+
+    def resolve(self, values) -> list:
+        """
+        Awaits the awaitables among values concurrently, e.g. the results of
+        async lookups. They run on the event loop of `BaseSheet.aload`, or on
+        a new event loop for other loads.
+
+        :param values: An iterable of awaitables and other values
+        :return: A list of results
+        """
+        return aio.run(values, loop=self.loop, limit=self.max_concurrency)
+
+
+def _accepts_context(clean) -> bool:
+    """
+    :param clean: A `clean` method
+    :return: Whether it accepts a context besides the value
+    """
+    try:
+        parameters = inspect.signature(clean).parameters.values()
+    except (TypeError, ValueError):
+        return True
+
+    positional = 0
+    for parameter in parameters:
+        if parameter.kind == parameter.VAR_POSITIONAL:
+            return True
+        if parameter.kind in (
+            parameter.POSITIONAL_ONLY,
+            parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            positional += 1
+        elif parameter.name == "context":
+            return True
+    # self, value and context
+    return positional >= 3
 
 
 class BaseField(ABC):
     target_type = None
     default = None
     cast_type = True
+    # Type code of an `array.array` that holds cleaned columns of this field
+    array_typecode = None
+    # dtype used when columns are returned as NumPy arrays
+    numpy_dtype = None
 
     def __init__(self, source, required=True, default=None, unique=False):
         """
@@ -23,27 +104,100 @@ class BaseField(ABC):
         self.required = required
         self.unique = unique
 
-        self.language = None
-        self.extra_context = None
-
         if default is not None:
             self.default = default
 
-    def __call__(self, value, language, extra_context=None):
-        if extra_context is None:
-            extra_context = {}
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Before fields were stateless, `clean` only received the value
+        clean = cls.__dict__.get("clean")
+        if clean is not None and not _accepts_context(clean):
+            warnings.warn(
+                f"{cls.__qualname__}.clean() should accept a context: clean(self, value, context=None)."
+                f" Support for clean(self, value) will be removed.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
+            @functools.wraps(clean)
+            def clean_without_context(self, value, context=None):
+                return clean(self, value)
 
-        self.extra_context = extra_context
-        self.language = language
+            cls.clean = clean_without_context
+
+    def __call__(self, value, language, extra_context=None):
+        context = FieldContext(language, extra_context)
 
         if value is None:
             value = self.get_default()
 
+        self.validate_required(value, context)
+
+        return self.clean(value, context)
+
+    def validate_required(self, value, context=None):
+        """
+        Raises a validation error if the field is required, but the value is missing
+        """
         if value is None and self.required is True:
-            msg = _("field.is_required", params={"field": self.source})
-            raise ValidationException(msg)
+            raise ValidationException(
+                code="field.is_required",
+                params={"field": self.source},
+                language=_language(context),
+            )
+
+    def prepare(self, values, context):
+        """
+        Called with a batch of raw values of the column before they are
+        cleaned, e.g. to look up related objects at once. Results may be kept
+        in the context’s cache.
+
+        :param list values: The raw values
+        :param FieldContext context: Describes the current load
+        """
+
+    def clean_column(self, values, context=None):
+        """
+        Cleans a whole column in one pass. When the field doesn’t override
+        `clean`, numeric columns are converted into an `array.array` at once
+        and columns that only hold values of the target type are taken as
+        they are. Otherwise, values are cleaned one at a time.
+
+        :param list values: The raw values of a column
+        :return: A tuple of (cleaned values, errors). Errors are
+                 (offset, `ValidationException`) tuples.
+        """
+        default = self.get_default()
+        types = set(map(type, values))
+
+        if default is not None and type(None) in types:
+            values = [default if value is None else value for value in values]
+            types = set(map(type, values))
+
+        if self.cast_type and type(self).clean is BaseField.clean:
+            if self.array_typecode and not types & {type(None), bool}:
+                try:
+                    return array.array(self.array_typecode, values), []
+                except (TypeError, ValueError, OverflowError):
+                    # Fall back to cleaning values one at a time
+                    pass
+
+            if types <= {self.get_target_type()}:
+                return list(values), []
+
+        cleaned = []
+        errors = []
 
-        return self.clean(value)
+        for offset, value in enumerate(values):
+            try:
+                self.validate_required(value, context)
+                cleaned.append(self.clean(value, context))
+            except ValidationException as error:
+                cleaned.append(None)
+                errors.append((offset, error))
+
+        return cleaned, errors
 
     def get_target_type(self):
         """
@@ -59,7 +213,40 @@ class BaseField(ABC):
         """
         return self.default
 
-    def clean(self, value):
+    def get_fingerprint(self) -> str:
+        """
+        Describes the field’s configuration, as part of the cache keys of
+        sheets: its class and all public attributes, including the ones set
+        on the class. Callables are described by their name, so that keys
+        stay the same across processes. Override it, if the result of
+        cleaning depends on anything else.
+        """
+        cls = type(self)
+        config = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                # Skip methods, but keep classes like `target_type`
+                if name.startswith("_") or inspect.isfunction(value):
+                    continue
+                if not isinstance(value, (property, staticmethod, classmethod)):
+                    config[name] = value
+        config.update(vars(self))
+
+        return repr(
+            (
+                f"{cls.__module__}.{cls.__qualname__}",
+                sorted((name, _describe(value)) for name, value in config.items()),
+            )
+        )
+
+    def clean(self, value, context=None):
+        """
+        Converts a value to the field’s target type
+
+        :param value: The value read from the spreadsheet
+        :param FieldContext context: Describes the current load
+        :raises ValidationException: If the value is invalid
+        """
         if value is None:
             return
 
@@ -83,8 +270,11 @@ class BaseField(ABC):
                         "target_type": self.get_target_type().__name__,
                         "actual_type": value.__class__.__name__,
                     }
-                    msg = _("field.wrong_type", params=params)
-                    raise ValidationException(msg)
+                    raise ValidationException(
+                        code="field.wrong_type",
+                        params=params,
+                        language=_language(context),
+                    )
 
         return value
 
@@ -93,26 +283,146 @@ class CharField(BaseField):
     target_type = str
 
 
-class DateField(BaseField):
+class BaseDateTimeField(BaseField):
+    """
+    Parses text and Excel serial numbers, e.g. from CSV files or cells that
+    aren’t formatted as dates. Text is parsed as ISO 8601 first, then with
+    each of `formats`. The format that matched last is tried first for the
+    following values of the load, so columns with a consistent format are
+    parsed with a single attempt per value.
+
+    Serial numbers are days since 1899-12-30, as used by Excel’s default
+    1900 date system.
+    """
+
+    target_type = datetime.datetime
+    # `strptime` formats tried after ISO 8601
+    formats = ()
+
+    def __init__(self, source, formats=None, **kwargs):
+        """
+        :param formats: `strptime` formats, defaults to the class’ `formats`
+        """
+        super().__init__(source, **kwargs)
+
+        if formats is not None:
+            self.formats = tuple(formats)
+
+    def _parse(self, value, context=None) -> datetime.datetime:
+        """
+        Converts text and serial numbers to a datetime
+
+        :raises ValidationException: If the value can’t be parsed
+        """
+        if type(value) in (int, float):
+            return self._from_serial(value, context)
+
+        text = value.strip()
+
+        # ISO 8601, e.g. 2022-01-07 or 2022-01-07T18:30:00
+        if text[4:5] == "-" and text[:4].isdigit():
+            if text.endswith("Z"):
+                text = text[:-1] + "+00:00"
+            try:
+                return datetime.datetime.fromisoformat(text)
+            except ValueError:
+                pass
+
+        cache = context.get_cache(self) if context is not None else {}
+        last_format = cache.get("format")
+        if last_format is not None:
+            try:
+                return datetime.datetime.strptime(text, last_format)
+            except ValueError:
+                pass
+
+        for date_format in self.formats:
+            if date_format == last_format:
+                continue
+            try:
+                parsed = datetime.datetime.strptime(text, date_format)
+            except ValueError:
+                continue
+            cache["format"] = date_format
+            return parsed
+
+        try:
+            return self._from_serial(float(text), context)
+        except ValueError:
+            raise ValidationException(
+                code="field.date_parse_error",
+                params={"field": self.source, "value": value},
+                language=_language(context),
+            )
+
+    def _from_serial(self, serial, context=None) -> datetime.datetime:
+        value = None
+        if 0 < serial < EXCEL_MAX_SERIAL:
+            # The same conversion as for cells, which reads serial numbers below 1 as times
+            value = _from_excel(serial, WINDOWS_EPOCH)
+        if not isinstance(value, datetime.datetime):
+            raise ValidationException(
+                code="field.date_parse_error",
+                params={"field": self.source, "value": serial},
+                language=_language(context),
+            )
+        return value
+
+
+class DateField(BaseDateTimeField):
     target_type = datetime.date
+    numpy_dtype = "datetime64[D]"
+    formats = ("%d.%m.%Y", "%Y/%m/%d")
+
+    def clean(self, value, context=None):
+        if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+            value = self._parse(value, context)
 
-    def clean(self, value):
         if isinstance(value, datetime.datetime):
             value = value.date()
 
-        return super().clean(value)
+        return super().clean(value, context)
+
+    def clean_column(self, values, context=None):
+        if set(map(type, values)) == {datetime.datetime}:
+            return [value.date() for value in values], []
+
+        if context is None:
+            # Remembers the matching format for the column
+            context = FieldContext()
+
+        return super().clean_column(values, context)
 
 
-class DateTimeField(BaseField):
+class DateTimeField(BaseDateTimeField):
     target_type = datetime.datetime
+    numpy_dtype = "datetime64[us]"
+    formats = ("%d.%m.%Y %H:%M:%S", "%d.%m.%Y %H:%M", "%Y/%m/%d %H:%M:%S")
+
+    def clean(self, value, context=None):
+        if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+            value = self._parse(value, context)
+
+        return super().clean(value, context)
+
+    def clean_column(self, values, context=None):
+        if context is None:
+            # Remembers the matching format for the column
+            context = FieldContext()
+
+        return super().clean_column(values, context)
 
 
 class FloatField(BaseField):
     target_type = float
+    array_typecode = "d"
+    numpy_dtype = "float64"
 
 
 class IntegerField(BaseField):
     target_type = int
+    array_typecode = "q"
+    numpy_dtype = "int64"
 
 
 class TimecodeField(FloatField):
@@ -121,34 +431,131 @@ class TimecodeField(FloatField):
     used in video and audio processing.
     """
 
-    def clean(self, value):
+    def clean(self, value, context=None):
         if isinstance(value, str):
-            value = self._timecode(value)
+            value = self._timecode(value, context)
 
-        return super().clean(value)
+        return super().clean(value, context)
 
-    def _timecode(self, timecode_string):
-        timecode_string = timecode_string.strip()
-        timecode_regex = re.compile(r"^(\d{1,2}):(\d{1,2}):(\d{1,2})([-,](\d))?$")
-        matches = timecode_regex.match(timecode_string)
+    def _timecode(self, timecode_string, context=None):
+        matches = TIMECODE_PATTERN.match(timecode_string.strip())
 
-        try:
-            hours = int(matches.group(1))
-            minutes = int(matches.group(2))
-            seconds = int(matches.group(3))
-
-            millis = matches.group(5)
-            if millis:
-                millis = int(millis)
-            else:
-                millis = 0
-        except Exception:
-            msg = _(
-                "field.timecode_parse_error",
+        if matches is None:
+            raise ValidationException(
+                code="field.timecode_parse_error",
                 params={"_timecode": timecode_string, "field": self.source},
+                language=_language(context),
             )
-            raise ValidationException(msg)
 
-        seconds = hours * 3600 + minutes * 60 + seconds + millis / 10
+        hours, minutes, seconds, fraction = matches.groups()
+        seconds = int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+
+        # Fractions may have any number of digits, e.g. 00:13:06,9 or 00:13:06.040
+        if fraction:
+            seconds += int(fraction) / 10 ** len(fraction)
 
         return seconds
+
+
+class RelatedField(BaseField):
+    """
+    Resolves values to related objects, e.g. database records. Objects are
+    looked up in bulk for each batch of rows and cached for the rest of the load.
+
+    `lookup` takes a list of distinct values and returns an iterable of
+    (value, object) pairs. It may be a coroutine function, in which case the
+    lookups of a batch run concurrently. With Django, that may look like:
+
+    ```
+    def lookup_artists(names):
+        return ((artist.name, artist) for artist in Artist.objects.filter(name__in=names))
+
+    artist = fields.RelatedField(source="Artist", lookup=lookup_artists)
+    ```
+    """
+
+    cast_type = False
+
+    def __init__(self, source, lookup, chunk_size=1000, **kwargs):
+        """
+        :param callable lookup: Resolves a list of values to (value, object) pairs
+        :param int chunk_size: The maximum number of values per lookup
+        """
+        super().__init__(source, **kwargs)
+        self.lookup = lookup
+        self.chunk_size = chunk_size
+
+    def prepare(self, values, context):
+        cache = context.get_cache(self)
+        missing = list(
+            dict.fromkeys(
+                value for value in values if value is not None and value not in cache
+            )
+        )
+
+        chunks = []
+        for start in range(0, len(missing), self.chunk_size):
+            end = start + self.chunk_size
+            chunks.append(missing[start:end])
+
+        results = [self.lookup(chunk) for chunk in chunks]
+        if any(inspect.isawaitable(result) for result in results):
+            results = context.resolve(results)
+
+        for chunk, pairs in zip(chunks, results):
+            for value in chunk:
+                cache[value] = []
+            for value, obj in pairs:
+                cache.setdefault(value, []).append(obj)
+
+    def clean(self, value, context=None):
+        if value is None:
+            return
+
+        if context is None:
+            context = FieldContext()
+
+        cache = context.get_cache(self)
+        if value not in cache:
+            # The value wasn’t prepared, e.g. because it’s a default value
+            self.prepare([value], context)
+
+        objs = cache[value]
+        params = {"field": self.source, "value": value}
+
+        if not objs:
+            raise ValidationException(
+                code="field.related_does_not_exist",
+                params=params,
+                language=context.language,
+            )
+
+        if len(objs) > 1:
+            raise ValidationException(
+                code="field.related_multiple_objects_returned",
+                params=params,
+                language=context.language,
+            )
+
+        return objs[0]
+
+
+def _language(context):
+    if context is None:
+        return default_language()
+    return context.language
+
+
+def _describe(value) -> str:
+    """
+    Describes a configuration value without memory addresses, see
+    `BaseField.get_fingerprint`
+    """
+    if isinstance(value, (list, tuple)):
+        return f"{type(value).__name__}({', '.join(map(_describe, value))})"
+    if isinstance(value, (set, frozenset)):
+        return f"{type(value).__name__}({', '.join(sorted(map(_describe, value)))})"
+    if callable(value):
+        name = getattr(value, "__qualname__", type(value).__qualname__)
+        return f"{getattr(value, '__module__', None)}.{name}"
+    return repr(value)
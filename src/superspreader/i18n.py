@@ -13,8 +13,26 @@ def default_language():
     return SUPPORTED_LANGUAGES[0]
 
 
+_messages = None
+
+
+def get_messages():
+    """
+    Imports the messages once. `messages` imports this module, so it can’t
+    be imported at the top.
+    """
+    global _messages
+
+    if _messages is None:
+        from .messages import messages
+
+        _messages = messages
+
+    return _messages
+
+
 def translate(key, language=default_language(), params={}):
-    from .messages import messages
+    messages = get_messages()
 
     default_lang = default_language()
     if language not in SUPPORTED_LANGUAGES:
@@ -7,6 +7,7 @@ messages = {
             None,
         ),
         "field.is_required": ("“%(field)s” is required", None),
+        "field.date_parse_error": ("“%(field)s” has an invalid date: %(value)s", None),
         "field.timecode_parse_error": (
             "“%(field)s” has an invalid format: %(_timecode)s",
             None,
@@ -20,10 +21,26 @@ messages = {
             None,
         ),
         "sheet.row_info": ("Row %(row)s: %(message)s", None),
+        "sheet.rows_info": ("Rows %(row)s–%(last_row)s: %(message)s", None),
         "sheet.column_missing": ("Column “%(column)s” not present in sheet", None),
         "sheet.sheet_missing": ("Sheet “%(sheet)s” not present in document", None),
+        "sheet.too_many_errors": ("Too many errors, stopped loading", None),
+        "sheet.skipped_row": ("Skipped row", None),
+        "sheet.blank_tail": ("Stopped reading after %(total)s blank rows", None),
+        "sheet.summary": ("%(label)s: %(total)s rows", None),
+        "sheet.summary_column": (
+            "%(label)s in column “%(column)s”: %(total)s rows",
+            None,
+        ),
+        "number.thousands_separator": (",", None),
         "sheet.unique_violation": (
-            "“%(column)s” must contain unique values only, but “%(value)s” occurs %(total)i times",
+            "“%(column)s” must contain unique values only, but “%(value)s” occurs %(total)i times"
+            " (rows %(rows)s)",
+            None,
+        ),
+        "sheet.unique_together_violation": (
+            "“%(columns)s” must be unique together, but “%(value)s” occurs %(total)i times"
+            " (rows %(rows)s)",
             None,
         ),
     },
@@ -34,6 +51,10 @@ messages = {
             None,
         ),
         "field.is_required": ("„%(field)s“ muss ausgefüllt sein", None),
+        "field.date_parse_error": (
+            "„%(field)s“ hat ein ungültiges Datum: %(value)s",
+            None,
+        ),
         "field.timecode_parse_error": (
             "„%(field)s“ hat ein ungültiges Format: %(_timecode)s",
             None,
@@ -47,10 +68,26 @@ messages = {
             None,
         ),
         "sheet.row_info": ("Zeile %(row)s: %(message)s", None),
+        "sheet.rows_info": ("Zeilen %(row)s–%(last_row)s: %(message)s", None),
         "sheet.column_missing": ("Die Spalte „%(column)s“ fehlt im Blatt", None),
         "sheet.sheet_missing": ("Das Blatt „%(sheet)s“ ist nicht vorhanden", None),
+        "sheet.too_many_errors": ("Zu viele Fehler, das Laden wurde abgebrochen", None),
+        "sheet.skipped_row": ("Übersprungen", None),
+        "sheet.blank_tail": ("Lesen nach %(total)s leeren Zeilen beendet", None),
+        "sheet.summary": ("%(label)s: %(total)s Zeilen", None),
+        "sheet.summary_column": (
+            "%(label)s in Spalte „%(column)s“: %(total)s Zeilen",
+            None,
+        ),
+        "number.thousands_separator": (".", None),
         "sheet.unique_violation": (
-            "„%(column)s“ darf nur eindeutige Werte enthalten, „%(value)s“ kommt aber %(total)i mal vor",
+            "„%(column)s“ darf nur eindeutige Werte enthalten, „%(value)s“ kommt aber %(total)i mal vor"
+            " (Zeilen %(rows)s)",
+            None,
+        ),
+        "sheet.unique_together_violation": (
+            "„%(columns)s“ müssen zusammen eindeutig sein, „%(value)s“ kommt aber %(total)i mal vor"
+            " (Zeilen %(rows)s)",
             None,
         ),
     },
@@ -0,0 +1,542 @@
+import csv
+import datetime
+import os
+import posixpath
+import re
+import sys
+import zipfile
+from abc import ABC, abstractmethod
+from itertools import islice
+from xml.etree import ElementTree
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+RELATIONSHIPS_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PACKAGE_RELATIONSHIPS_NS = (
+    "http://schemas.openxmlformats.org/package/2006/relationships"
+)
+
+WINDOWS_EPOCH = datetime.datetime(1899, 12, 30)
+MAC_EPOCH = datetime.datetime(1904, 1, 1)
+
+# Built-in number formats, that format dates and times
+BUILTIN_DATE_FORMATS = frozenset((14, 15, 16, 17, 18, 19, 20, 21, 22, 45, 46, 47))
+BUILTIN_TIMEDELTA_FORMATS = frozenset((46,))
+# Quoted text and brackets other than elapsed time, like [h], can’t make a format a date format
+NUMBER_FORMAT_LITERALS = re.compile(r'".*?"|\[(?!hh?\]|mm?\]|ss?\])[^\]]*\]')
+DATE_FORMAT_PATTERN = re.compile(r"[^\\][dmhysDMHYS]")
+TIMEDELTA_FORMAT_PATTERN = re.compile(
+    r"\[hh?\](:mm(:ss(\.0*)?)?)?|\[mm?\](:ss(\.0*)?)?|\[ss?\](\.0*)?", re.I
+)
+
+
+def load_workbook(*args, **kwargs):
+    """
+    Opens a workbook with openpyxl. openpyxl is imported when it’s needed,
+    so importing superspreader stays fast.
+    """
+    import openpyxl
+
+    return openpyxl.load_workbook(*args, **kwargs)
+
+
+class BaseReader(ABC):
+    """
+    Reads the rows of a sheet as tuples of cell values. Row numbers are one
+    based, like in spreadsheet applications.
+    """
+
+    def __init__(self, path, read_only=False):
+        """
+        :param path: The document’s path
+        :param bool read_only: Whether to stream the document, if supported
+        """
+        self.path = path
+        self.read_only = read_only
+
+    @abstractmethod
+    def open(self, sheet_name) -> None:
+        """
+        Opens a sheet of the document
+        :raises KeyError: If the sheet isn’t present
+        """
+
+    @abstractmethod
+    def iter_rows(self, min_row=1, max_row=None, min_col=None, max_col=None):
+        """
+        :param int min_row: The first row to read
+        :param int max_row: The last row to read, read all rows when `None`
+        :param int min_col: The first column to read, the first column when `None`
+        :param int max_col: The last column to read, read all columns when `None`
+        :return: An iterator of tuples of cell values. The first value is the
+                 cell in `min_col`.
+        """
+
+    def close(self) -> None:
+        """
+        Releases resources held by the reader
+        """
+
+
+class OpenpyxlReader(BaseReader):
+    """
+    Reads Excel documents using openpyxl
+    """
+
+    def __init__(self, path, read_only=False, workbook=None):
+        """
+        :param workbook: An opened workbook to read from instead of opening
+                         `path`. It’s shared, so it isn’t closed by the reader.
+        """
+        super().__init__(path, read_only=read_only)
+        self._workbook = workbook
+        self._owns_workbook = workbook is None
+        self._sheet = None
+
+    def open(self, sheet_name) -> None:
+        if self._workbook is None:
+            self._workbook = load_workbook(
+                filename=self.path, read_only=self.read_only, data_only=True
+            )
+        self._sheet = self._workbook[sheet_name]
+
+    def iter_rows(self, min_row=1, max_row=None, min_col=None, max_col=None):
+        return self._sheet.iter_rows(
+            min_row=min_row,
+            max_row=max_row,
+            min_col=min_col,
+            max_col=max_col,
+            values_only=True,
+        )
+
+    def close(self) -> None:
+        # Read-only workbooks keep the file open until closed explicitly.
+        # Shared workbooks are closed by their owner.
+        if self._owns_workbook and self._workbook is not None:
+            if self._workbook.read_only:
+                self._workbook.close()
+            self._workbook = None
+
+
+class XLSXReader(BaseReader):
+    """
+    Streams Excel documents straight out of the zip archive with an incremental
+    XML parser, without creating openpyxl workbooks and cells. Rows are plain
+    tuples of numbers, strings, booleans and dates, read like openpyxl’s
+    `data_only` mode: formulas are read as their cached values.
+
+    The shared strings are read once, numbers in date formats are converted
+    using the workbook’s date system (1900 or 1904). Documents the reader
+    doesn’t support, e.g. strict Office Open XML, are read with openpyxl instead.
+
+    ```
+    class AlbumSheet(BaseSheet):
+        reader_class = XLSXReader
+    ```
+    """
+
+    fallback_class = OpenpyxlReader
+
+    def __init__(self, path, read_only=False):
+        """
+        :param bool read_only: The document is always streamed, this only
+                               applies if it’s read by the fallback reader
+        """
+        super().__init__(path, read_only=read_only)
+        self._archive = None
+        self._fallback = None
+        self._sheet_path = None
+        self._shared_strings = []
+        self._date_styles = frozenset()
+        self._timedelta_styles = frozenset()
+        self._epoch = WINDOWS_EPOCH
+        # Maps column letters to column numbers
+        self._columns = {}
+
+    def open(self, sheet_name) -> None:
+        try:
+            self.__open_archive(sheet_name)
+        except _UnsupportedDocument:
+            self.close()
+            self._fallback = self.fallback_class(self.path, read_only=self.read_only)
+            self._fallback.open(sheet_name)
+
+    def iter_rows(self, min_row=1, max_row=None, min_col=None, max_col=None):
+        if self._fallback is not None:
+            return self._fallback.iter_rows(
+                min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col
+            )
+        return self.__iter_rows(min_row, max_row, min_col or 1, max_col)
+
+    def close(self) -> None:
+        if self._fallback is not None:
+            self._fallback.close()
+            self._fallback = None
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+
+    # === Private ===
+
+    def __open_archive(self, sheet_name) -> None:
+        """
+        Finds the sheet’s part in the archive and reads the shared strings,
+        the date styles and the date system of the workbook.
+
+        :raises KeyError: If the sheet isn’t present
+        :raises _UnsupportedDocument: If the document can’t be read by this reader
+        """
+        try:
+            self._archive = zipfile.ZipFile(self.path)
+        except (zipfile.BadZipFile, OSError):
+            # Let openpyxl report documents that aren’t zip archives
+            raise _UnsupportedDocument()
+
+        package_rels = self.__relationships("")
+        workbook_path = package_rels.get(f"{RELATIONSHIPS_NS}/officeDocument", {}).get(
+            None
+        )
+        if workbook_path is None:
+            raise _UnsupportedDocument()
+
+        workbook = self.__parse(workbook_path)
+        if workbook.tag != _tag("workbook"):
+            raise _UnsupportedDocument()
+
+        properties = workbook.find(_tag("workbookPr"))
+        if properties is not None and properties.get("date1904") in ("1", "true"):
+            self._epoch = MAC_EPOCH
+
+        for sheet in workbook.iterfind(f"{_tag('sheets')}/{_tag('sheet')}"):
+            if sheet.get("name") == sheet_name:
+                sheet_id = sheet.get(f"{{{RELATIONSHIPS_NS}}}id")
+                break
+        else:
+            raise KeyError(sheet_name)
+
+        workbook_rels = self.__relationships(workbook_path)
+        self._sheet_path = workbook_rels.get(f"{RELATIONSHIPS_NS}/worksheet", {}).get(
+            sheet_id
+        )
+        if self._sheet_path is None:
+            # E.g. a chart sheet
+            raise _UnsupportedDocument()
+
+        for shared_strings_path in workbook_rels.get(
+            f"{RELATIONSHIPS_NS}/sharedStrings", {}
+        ).values():
+            self._shared_strings = self.__read_shared_strings(shared_strings_path)
+        for styles_path in workbook_rels.get(f"{RELATIONSHIPS_NS}/styles", {}).values():
+            self.__read_styles(styles_path)
+
+    def __relationships(self, part_path) -> dict:
+        """
+        :param part_path: The path of a part in the archive, "" for the package
+        :return: A dict of {relationship type: {id: path of the target}}
+        """
+        directory, name = posixpath.split(part_path)
+        rels_path = posixpath.join(directory, "_rels", f"{name}.rels")
+        relationships = {}
+
+        for relationship in self.__parse(rels_path).iter(
+            f"{{{PACKAGE_RELATIONSHIPS_NS}}}Relationship"
+        ):
+            if relationship.get("TargetMode") == "External":
+                continue
+            target = relationship.get("Target", "")
+            if target.startswith("/"):
+                target = target[1:]
+            else:
+                target = posixpath.normpath(posixpath.join(directory, target))
+
+            targets = relationships.setdefault(relationship.get("Type"), {})
+            targets[relationship.get("Id")] = target
+            # The package’s only office document is looked up without an id
+            targets.setdefault(None, target)
+
+        return relationships
+
+    def __parse(self, path):
+        try:
+            with self._archive.open(path) as fp:
+                return ElementTree.parse(fp).getroot()
+        except KeyError:
+            raise _UnsupportedDocument()
+
+    def __read_shared_strings(self, path) -> list:
+        """
+        Reads the shared strings table. Strings are interned, as the same
+        strings are often repeated across documents, e.g. in labels.
+        """
+        strings = []
+        item_tag = _tag("si")
+        intern = sys.intern
+
+        try:
+            with self._archive.open(path) as fp:
+                for _event, element in ElementTree.iterparse(fp):
+                    if element.tag == item_tag:
+                        strings.append(intern(_text_content(element)))
+                        element.clear()
+        except KeyError:
+            raise _UnsupportedDocument()
+
+        return strings
+
+    def __read_styles(self, path) -> None:
+        """
+        Works out which cell styles format numbers as dates or as elapsed time
+        """
+        styles = self.__parse(path)
+        custom_formats = {
+            int(number_format.get("numFmtId")): number_format.get("formatCode", "")
+            for number_format in styles.iterfind(f"{_tag('numFmts')}/{_tag('numFmt')}")
+        }
+        date_styles = set()
+        timedelta_styles = set()
+
+        for index, xf in enumerate(styles.iterfind(f"{_tag('cellXfs')}/{_tag('xf')}")):
+            format_id = int(xf.get("numFmtId", 0))
+            if format_id in custom_formats:
+                code = custom_formats[format_id].split(";")[0]
+                is_date = bool(
+                    DATE_FORMAT_PATTERN.search(NUMBER_FORMAT_LITERALS.sub("", code))
+                )
+                is_timedelta = bool(TIMEDELTA_FORMAT_PATTERN.search(code))
+            else:
+                is_date = format_id in BUILTIN_DATE_FORMATS
+                is_timedelta = format_id in BUILTIN_TIMEDELTA_FORMATS
+
+            # Cells refer to styles by their index, which is kept as text
+            if is_date:
+                date_styles.add(str(index))
+            if is_date and is_timedelta:
+                timedelta_styles.add(str(index))
+
+        self._date_styles = frozenset(date_styles)
+        self._timedelta_styles = frozenset(timedelta_styles)
+
+    def __iter_rows(self, min_row, max_row, min_col, max_col):
+        """
+        Parses the sheet’s rows one after another, clearing each parsed row.
+        Only end events are requested, which halves the events per cell.
+        Missing rows are yielded as empty rows, and rows are padded to
+        `max_col` or the sheet’s dimension, like openpyxl’s read-only mode.
+        """
+        row_tag = _tag("row")
+        dimension_tag = _tag("dimension")
+        # The dimension is only used for padding, as it may be out of date
+        width = max_col - min_col + 1 if max_col is not None else None
+        padded_width = width
+        empty_row = (None,) * width if width else ()
+        row_number = 0
+        next_row_number = min_row
+
+        with self._archive.open(self._sheet_path) as fp:
+            for _event, element in ElementTree.iterparse(fp):
+                tag = element.tag
+                if tag == dimension_tag:
+                    if width is None:
+                        last_cell = element.get("ref", "").rpartition(":")[2]
+                        padded_width = max(self.__column(last_cell) - min_col + 1, 0)
+                        empty_row = (None,) * padded_width
+                    continue
+                if tag != row_tag:
+                    continue
+
+                row_number = int(element.get("r") or row_number + 1)
+                if max_row is not None and row_number > max_row:
+                    break
+                if row_number >= min_row:
+                    values = self.__row_values(element, min_col, width, padded_width)
+                    while next_row_number < row_number:
+                        yield empty_row
+                        next_row_number += 1
+                    yield values
+                    next_row_number = row_number + 1
+
+                element.clear()
+                if max_row is not None and row_number >= max_row:
+                    break
+
+    def __row_values(self, row, min_col, width, padded_width) -> tuple:
+        values = []
+        value_tag = _tag("v")
+        column = min_col - 1
+        shared_strings = self._shared_strings
+        date_styles = self._date_styles
+
+        for cell in row:
+            reference = cell.get("r")
+            column = self.__column(reference) if reference else column + 1
+            position = column - min_col
+            if position < 0:
+                continue
+            if width is not None and position >= width:
+                break
+
+            data_type = cell.get("t")
+            if data_type == "inlineStr":
+                inline_string = cell.find(_tag("is"))
+                value = (
+                    _text_content(inline_string) if inline_string is not None else None
+                )
+            else:
+                value = cell.findtext(value_tag) or None
+
+            if value is None:
+                continue
+            elif data_type is None or data_type == "n":
+                if "." in value or "E" in value or "e" in value:
+                    value = float(value)
+                else:
+                    value = int(value)
+                style = cell.get("s")
+                if style in date_styles:
+                    value = _from_excel(
+                        value, self._epoch, style in self._timedelta_styles
+                    )
+            elif data_type == "s":
+                value = shared_strings[int(value)]
+            elif data_type == "b":
+                value = value == "1" or value == "true"
+            elif data_type == "d":
+                value = _from_iso(value)
+
+            if position > len(values):
+                values.extend([None] * (position - len(values)))
+            values.append(value)
+
+        if padded_width is not None and len(values) < padded_width:
+            values.extend([None] * (padded_width - len(values)))
+        return tuple(values)
+
+    def __column(self, reference) -> int:
+        """
+        :param reference: A cell reference, e.g. "AB12", or column letters
+        :return: The one based column number
+        """
+        letters = reference.rstrip("0123456789")
+        try:
+            return self._columns[letters]
+        except KeyError:
+            column = 0
+            for letter in letters.upper():
+                column = column * 26 + ord(letter) - 64
+            self._columns[letters] = column
+            return column
+
+
+class _UnsupportedDocument(Exception):
+    """
+    Raised by `XLSXReader` for documents that are read by openpyxl instead
+    """
+
+
+def _tag(name):
+    return f"{{{MAIN_NS}}}{name}"
+
+
+def _text_content(element) -> str:
+    """
+    :param element: A shared string item or inline string
+    :return: Its plain text, or the text of its runs for rich text.
+             Phonetic hints are left out.
+    """
+    text = element.findtext(_tag("t")) or ""
+    runs = element.findall(f"{_tag('r')}/{_tag('t')}")
+    if runs:
+        text += "".join(run.text or "" for run in runs)
+    return text
+
+
+def _from_excel(serial, epoch, as_timedelta=False):
+    """
+    Converts a serial number to a datetime, like openpyxl does. Serial numbers
+    below 1 are times of day, and elapsed time formats are read as timedeltas.
+    """
+    if as_timedelta:
+        value = datetime.timedelta(days=serial)
+        if value.microseconds:
+            # Round to milliseconds
+            value = datetime.timedelta(
+                seconds=value.total_seconds() // 1,
+                microseconds=round(value.microseconds, -3),
+            )
+        return value
+
+    day, fraction = divmod(serial, 1)
+    time = datetime.timedelta(milliseconds=round(fraction * 86400000))
+    if 0 <= serial < 1 and time.days == 0:
+        return (datetime.datetime.min + time).time()
+    if 0 < serial < 60 and epoch == WINDOWS_EPOCH:
+        # Excel treats 1900 as a leap year, serial number 60 is 29 Feb 1900
+        day += 1
+    try:
+        return epoch + datetime.timedelta(days=day) + time
+    except OverflowError:
+        return "#VALUE!"
+
+
+def _from_iso(value):
+    try:
+        if value.endswith("Z"):
+            value = value[:-1]
+        if "T" not in value:
+            return datetime.datetime.fromisoformat(value + "T00:00")
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return value
+
+
+class CSVReader(BaseReader):
+    """
+    Streams comma separated files using the `csv` module. Files only have one
+    sheet, so the sheet name is ignored. Empty cells are read as `None`.
+    """
+
+    delimiter = ","
+    encoding = "utf-8-sig"
+
+    def open(self, sheet_name) -> None:
+        pass
+
+    def iter_rows(self, min_row=1, max_row=None, min_col=None, max_col=None):
+        start = min_col - 1 if min_col else 0
+
+        with open(self.path, newline="", encoding=self.encoding) as fp:
+            reader = csv.reader(fp, delimiter=self.delimiter)
+            for row in islice(reader, min_row - 1, max_row):
+                if start or max_col is not None:
+                    row = row[start:max_col]
+                yield tuple(value if value != "" else None for value in row)
+
+
+class TSVReader(CSVReader):
+    """
+    Streams tab separated files
+    """
+
+    delimiter = "\t"
+
+
+READERS_BY_EXTENSION = {
+    ".csv": CSVReader,
+    ".tsv": TSVReader,
+    ".tab": TSVReader,
+}
+
+
+def get_reader_class(path):
+    """
+    Picks a reader by the file extension, falling back to openpyxl
+
+    :param path: The document’s path
+    :return: A `BaseReader` subclass
+    """
+    try:
+        extension = os.path.splitext(os.fspath(path))[1].lower()
+    except TypeError:
+        # File objects are passed to openpyxl
+        return OpenpyxlReader
+
+    return READERS_BY_EXTENSION.get(extension, OpenpyxlReader)
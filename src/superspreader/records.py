@@ -0,0 +1,137 @@
+from .i18n import default_language
+from .i18n import translate as _
+
+
+class Record:
+    """
+    An error or info of a sheet. Records are stored in a structured way and
+    only formatted to text when they are read, in any supported language.
+    """
+
+    __slots__ = ("code", "params", "row", "last_row", "column", "text", "language")
+
+    def __init__(
+        self,
+        code=None,
+        params=None,
+        row=None,
+        column=None,
+        text=None,
+        language=None,
+        last_row=None,
+    ):
+        """
+        :param str code: The code of a message in `messages`
+        :param dict params: The message params
+        :param int row: The row number, as shown in spreadsheet applications
+        :param int last_row: The last row number, if the record relates to a range of rows
+        :param str column: The column the record relates to
+        :param str text: A message that isn’t translated, used when there’s no code
+        :param language: The language to format the record in by default
+        """
+        self.code = code
+        self.params = params if params is not None else {}
+        self.row = row
+        self.last_row = last_row
+        self.column = column
+        self.text = text
+        self.language = language
+
+    @classmethod
+    def from_exception(cls, error, row=None, column=None, language=None):
+        """
+        Creates a record from a `ValidationException`
+        """
+        if error.code is None:
+            return cls(text=str(error), row=row, column=column, language=language)
+
+        return cls(
+            code=error.code,
+            params=error.params,
+            row=row,
+            column=column,
+            language=language,
+        )
+
+    def format(self, language=None) -> str:
+        """
+        :param language: Defaults to the record’s language
+        :return: The record as text
+        """
+        if language is None:
+            language = self.language or default_language()
+
+        if self.code is None:
+            message = self.text
+        else:
+            message = _(self.code, language, params=self.params)
+
+        if self.row is None:
+            return message
+
+        if self.last_row is not None and self.last_row != self.row:
+            params = {"row": self.row, "last_row": self.last_row, "message": message}
+            return _("sheet.rows_info", language, params=params)
+
+        return _(
+            "sheet.row_info", language, params={"row": self.row, "message": message}
+        )
+
+    def __str__(self):
+        return self.format()
+
+    def __repr__(self):
+        return f"<Record {self.code or self.text!r} row={self.row}>"
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name in self.__slots__:
+            setattr(self, name, state.get(name))
+
+
+def summarize(records, language=None):
+    """
+    Groups records by code and column, e.g.
+    "wrong_type in column “Chart Position”: 40,512 rows"
+
+    :param records: An iterable of records
+    :param language: The language of the summary
+    :return: A list of strings, most frequent first
+    """
+    if language is None:
+        language = default_language()
+
+    counts = {}
+    for record in records:
+        if record.code is None:
+            key = (None, record.text, record.column)
+        else:
+            key = (record.code, None, record.column)
+        counts[key] = counts.get(key, 0) + 1
+
+    lines = []
+    for (code, text, column), total in sorted(
+        counts.items(), key=lambda item: -item[1]
+    ):
+        # Codes are namespaced, e.g. “field.wrong_type”
+        label = code.rsplit(".", 1)[-1] if code is not None else text
+        params = {
+            "label": label,
+            "column": column,
+            "total": _format_number(total, language),
+        }
+
+        if column is None:
+            lines.append(_("sheet.summary", language, params=params))
+        else:
+            lines.append(_("sheet.summary_column", language, params=params))
+
+    return lines
+
+
+def _format_number(number, language):
+    formatted = f"{number:,}"
+    thousands_separator = _("number.thousands_separator", language)
+    return formatted.replace(",", thousands_separator)
@@ -1,25 +1,76 @@
+import inspect
+import threading
 from abc import ABC
+from array import array
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from itertools import islice
 
-from openpyxl import load_workbook
-
+from . import aio
 from .exceptions import ImproperlyConfigured, ValidationException
-from .fields import BaseField
+from .fields import BaseField, FieldContext
 from .i18n import EN
-from .i18n import translate as _
+from .readers import OpenpyxlReader, get_reader_class
+from .records import Record, summarize
+from .stats import LoadStats
+from .views import Projection, RowsView
+
+UNIQUE_VIOLATION_CODES = ("sheet.unique_violation", "sheet.unique_together_violation")
 
 
 class BaseSheet(ABC):
     header_rows = 1
     sheet_name = None
     label_row = None
+    read_only = False
+    # Tuples of field names, whose combined values must be unique
+    unique_together = ()
+    # A `cache.ResultCache` to store results of `load` in
+    result_cache = None
+    # A `readers.BaseReader` subclass, picked by the file extension when `None`
+    reader_class = None
+    # The number of rows fields prepare at once, see `BaseField.prepare`
+    batch_size = 1000
+    # Record timings of each load in a `stats.LoadStats`, see `stats`
+    profile = False
+    # Stop loading once there are this many errors
+    max_errors = None
+    # Stop loading after this many consecutive rows with errors
+    max_consecutive_error_rows = None
+    # Stop reading after this many consecutive skipped blank rows, e.g. in
+    # the formatted but empty tail of a sheet. `None` reads all rows.
+    blank_row_threshold = None
+    # Store rows as tuples, which take a fraction of the memory of dicts.
+    # Row dicts are built when rows are accessed.
+    compact_rows = False
 
-    def __init__(self, path, language=EN, extra_data=None):
+    def __init__(self, path, language=EN, extra_data=None, workbook=None):
+        """
+        :param path: The document’s path
+        :param language: The language of errors and infos
+        :param dict extra_data: Data added to each row, see `get_extra_data`
+        :param workbook: An opened openpyxl workbook to read from instead of
+                         opening `path`. It’s shared, so it isn’t closed
+                         by the sheet.
+        """
         self.language = language
         self.path = path
+        self._workbook = workbook
         self._fields = self._build_fields()
         self._rows = []
+        # The keys of compact rows, shared by all rows
+        self._row_names = None
+        self._columns = {}
         self._infos = []
-        self._errors = []
+        # Records are keys of a dict, which keeps their order and allows
+        # removing them when rows are revalidated
+        self._errors = {}
+        self._stats = None
+        # State kept for `revalidate`
+        self._positions = {}
+        self._row_errors = {}
+        self._unique_index = {}
+        self._unique_errors = {}
 
         if extra_data is not None:
             assert isinstance(extra_data, dict)
@@ -44,19 +95,30 @@ class BaseSheet(ABC):
 
         return data
 
-    def rows(self, exclude=None):
-        """
-        :param exclude: Iterable of field names to exclude
-        :return: A list of row dicts
+    def rows(self, exclude=None, include=None, rename=None, copy=False):
         """
+        Returns the loaded rows as read-only views, which neither copy nor
+        change the rows kept by the sheet.
 
-        rows = self._rows.copy()
+        ```
+        sheet.rows(include=["artist", "album"], rename={"album": "title"})
+        ```
 
-        if exclude:
-            for record in rows:
-                for field in exclude:
-                    record.pop(field)
+        :param exclude: Iterable of field names to exclude
+        :param include: Iterable of field names to include, all when `None`
+        :param dict rename: Maps field names to the names they’re shown as
+        :param copy: Return a list of independent dicts instead of views
+        :return: A `views.RowsView` of `views.RowView`, or a list of dicts
+        :raises ValueError: If a field is renamed to the name of another shown field
+        """
+        keys = self._row_names
+        if keys is None and self._rows:
+            keys = list(self._rows[0])
+        projection = Projection(include, exclude, rename, self._row_names, keys=keys)
+        rows = RowsView(self._rows, projection)
 
+        if copy:
+            return rows.copy()
         return rows
 
     def shall_skip(self, row: dict):
@@ -72,62 +134,274 @@ class BaseSheet(ABC):
             return False
         return True
 
-    def load(self, extra_context=None):
+    def load(self, extra_context=None, read_only=None, columnar=False, stats=None):
         """
         Loads the spreadsheet and map its contents to dicts.
+
+        :param extra_context: A dictionary that is passed to the fields
+        :param read_only: Stream the workbook using openpyxl’s read-only mode,
+                          which keeps memory usage flat for large documents.
+                          Defaults to the sheet’s `read_only` attribute.
+                          Ignored for shared workbooks.
+        :param columnar: Gather the values of each column and clean them
+                         column by column, see `BaseField.clean_column`.
+                         The cleaned columns are available via `columns()`.
+                         Results of columnar loads aren’t cached, and error
+                         budgets (`max_errors`) don’t apply. Neither are results
+                         of sheets with fields that prepare values, e.g.
+                         `RelatedField`, as looked up objects may change.
+        :param stats: A `stats.LoadStats` instance to record timings in.
+                      Created automatically if the sheet’s `profile` attribute
+                      is set. Results restored from the cache aren’t recorded.
         :return:
         """
-        if extra_context is None:
-            extra_context = {}
+        if columnar:
+            with self.__open_sheet(extra_context, read_only, stats) as (
+                reader,
+                context,
+            ):
+                if reader is not None:
+                    self.__load_columns(reader, context)
+            return
 
-        header_rows = self.get_header_rows()
-        fields = self._fields
-        sheet = self.__get_sheet()
+        cache = self.result_cache
+        if cache is not None and self.__prepares_values():
+            # Related objects may change without the document changing
+            cache = None
+        if cache is not None:
+            key = cache.make_key(self.path, self._get_fingerprint(extra_context))
+            if self.__restore(cache.get(key)):
+                return
 
-        if self.has_errors:
-            return
+        with self.__open_sheet(extra_context, read_only, stats) as (reader, context):
+            if reader is not None:
+                positions = self._positions
+                rows = self._rows
+                pack = self.__pack
+                for row, _row_errors, row_index in self.__iter_rows(reader, context):
+                    positions[row_index] = len(rows)
+                    rows.append(pack(row))
 
-        column_map = self.__column_map(sheet)
-        self.__check_columns_present(column_map)
+        if cache is not None:
+            cache.set(key, self.__result())
 
-        if self.has_errors:
-            return
+    def iter_load(self, extra_context=None, read_only=None, stats=None):
+        """
+        Loads the spreadsheet and yields its rows one at a time, without keeping
+        them on the sheet. Errors and infos are collected as usual, unique
+        violations are added once all rows have been yielded.
 
-        min_row = header_rows + 1
+        :param extra_context: A dictionary that is passed to the fields
+        :param read_only: See `load`
+        :param stats: See `load`
+        :return: A generator of (row dict, list of row errors) tuples
+        """
+        with self.__open_sheet(extra_context, read_only, stats) as (reader, context):
+            if reader is not None:
+                for row, row_errors, _row_index in self.__iter_rows(reader, context):
+                    yield row, row_errors
+
+    async def aload(self, extra_context=None, read_only=None, max_concurrency=10):
+        """
+        Loads the spreadsheet without blocking the event loop, see `aiter_load`.
+        Results aren’t cached.
 
-        for row_index, row_cells in enumerate(sheet.iter_rows(min_row=min_row)):
-            row_dict = {}
-            error_cache = []
-            for name, field in fields.items():
-                cell_index = column_map.get(field.source)
+        :param extra_context: A dictionary that is passed to the fields
+        :param read_only: See `load`
+        :param int max_concurrency: The maximum number of awaitables in flight
+        """
+        async for row, _row_errors, row_index in self.__aiter_rows(
+            extra_context, read_only, max_concurrency
+        ):
+            self._positions[row_index] = len(self._rows)
+            self._rows.append(self.__pack(row))
+
+    async def aiter_load(self, extra_context=None, read_only=None, max_concurrency=10):
+        """
+        Loads the spreadsheet in a thread and yields its rows on the event
+        loop, like `iter_load`. Rows are passed to the loop in batches of
+        `batch_size`.
+
+        Callables in `extra_data` may be coroutine functions. Their results are
+        awaited concurrently for each batch of rows. The same applies to
+        awaitables returned by `BaseField.prepare` and lookups of `RelatedField`.
+
+        ```
+        async def fetch_cover(row):
+            return await covers.get(row["album"])
+
+        sheet = AlbumSheet("albums.xlsx", extra_data={"cover": fetch_cover})
+        async for row_dict, row_errors in sheet.aiter_load():
+            await save(row_dict)
+        ```
+
+        :param extra_context: A dictionary that is passed to the fields
+        :param read_only: See `load`
+        :param int max_concurrency: The maximum number of awaitables in flight
+        :return: An async generator of (row dict, list of row errors) tuples
+        """
+        async for row, row_errors, _row_index in self.__aiter_rows(
+            extra_context, read_only, max_concurrency
+        ):
+            yield row, row_errors
+
+    def validate(self, sample_size=100, extra_context=None, read_only=True):
+        """
+        Checks whether the sheet and its columns are present and cleans the
+        first rows, without loading the whole document. Rows aren’t kept, and
+        unique fields are only validated if the sheet has no more rows than
+        the sample. Check `errors` for details.
+
+        :param int sample_size: The number of rows to clean
+        :param extra_context: A dictionary that is passed to the fields
+        :param read_only: See `load`. Streams the document by default.
+        :return: Whether there are no errors
+        """
+        with self.__open_sheet(extra_context, read_only) as (reader, context):
+            if reader is None:
+                return False
+
+            if sample_size < 1:
+                self.__check_columns_present(self.__column_map(reader))
+                return not self.has_errors
+
+            for _row in self.__iter_rows(reader, context, sample_size=sample_size):
+                pass
+
+        return not self.has_errors
+
+    def export(self, exporter, extra_context=None, read_only=None) -> int:
+        """
+        Loads the sheet and writes its rows to an exporter while they’re
+        read, without keeping them on the sheet. Errors and infos are collected
+        as usual, rows with errors are exported with `None` for invalid values.
 
+        ```
+        sheet.export(SQLiteExporter("albums.sqlite3", table="albums"))
+        ```
+
+        :param exporter: A `exporters.BaseExporter` instance
+        :param extra_context: A dictionary that is passed to the fields
+        :param read_only: See `load`
+        :return: The number of rows written
+        """
+        rows = (
+            row
+            for row, _row_errors in self.iter_load(extra_context, read_only=read_only)
+        )
+        return exporter.export(rows, types=self.get_target_types())
+
+    def revalidate(self, changes, extra_context=None):
+        """
+        Cleans changed cells of loaded rows again, e.g. once users fixed
+        errors. Only the changed cells are cleaned; rows, errors and unique
+        violations are updated in place, so the cost doesn’t depend on the
+        size of the document. Errors of changed cells are appended to `errors`.
+
+        ```
+        sheet.load()
+        sheet.revalidate({3: {"Chart Position": 12}})
+        ```
+
+        :param changes: A dictionary that maps row indexes to dictionaries of
+                        raw values by column label. The index of a row is its
+                        row number minus `header_rows` minus one.
+        :param extra_context: A dictionary that is passed to the fields
+        :raises KeyError: If a row hasn’t been loaded, e.g. because it was
+                          skipped, or a column label isn’t a field’s source
+        :return: Whether there are no errors
+        """
+        fields = {field.source: (name, field) for name, field in self._fields.items()}
+        context = FieldContext(self.language, extra_context)
+        unique_keys = list(self._unique_index)
+
+        for row_index, values in changes.items():
+            if row_index not in self._positions:
+                raise KeyError(f"Row {self._row_number(row_index)} hasn’t been loaded")
+            for source in values:
+                if source not in fields:
+                    raise KeyError(f"“{source}” isn’t the source of a field")
+
+        # Let fields prepare all changed values at once, see `BaseField.prepare`
+        for source, (_name, field) in fields.items():
+            if type(field).prepare is not BaseField.prepare:
+                values = [row[source] for row in changes.values() if source in row]
+                if values:
+                    self._prepare(field, values, context)
+
+        for row_index, values in changes.items():
+            position = self._positions[row_index]
+            row = self.__unpack(self._rows[position])
+            old_keys = [self.__unique_value(row, names) for names in unique_keys]
+            row_dict = {name: row[name] for name in self._fields}
+
+            for source, value in values.items():
+                name, field = fields[source]
+                self.__discard_row_errors(row_index, source)
+
+                if value is None:
+                    value = field.get_default()
                 try:
-                    cell = row_cells[cell_index]
-                    try:
-                        row_dict[name] = field(
-                            cell.value,
-                            language=self.language,
-                            extra_context=extra_context,
-                        )
-                    except ValidationException as error:
-                        row_dict[name] = None
-                        error_cache.append((str(error), row_index))
-                except KeyError:
-                    pass
+                    field.validate_required(value, context)
+                    row_dict[name] = field.clean(value, context)
+                except ValidationException as error:
+                    row_dict[name] = None
+                    record = Record.from_exception(
+                        error, column=source, language=self.language
+                    )
+                    self._add_error(record, row_index)
 
-            # Evaluate before adding extra data
-            if self.shall_skip(row_dict):
-                self._add_info("Skipped row", index=row_index)
-                continue
+            full_dict = self._build_row(row_dict)
+            if type(self._rows[position]) is dict:
+                # Update in place, so references to the row stay valid
+                row.clear()
+                row.update(full_dict)
             else:
-                # Use extra data as a basis
-                full_dict = self.get_extra_data(row_dict)
-                # And update with “real” data, which takes precedence
-                full_dict.update(row_dict)
-                self._rows.append(full_dict)
-                self._add_errors(error_cache)
+                self._rows[position] = self.__pack(full_dict)
+
+            for names, old_key in zip(unique_keys, old_keys):
+                new_key = self.__unique_value(full_dict, names)
+                if new_key != old_key:
+                    self.__move_unique_value(names, row_index, old_key, new_key)
+
+        return not self.has_errors
+
+    def columns(self, as_numpy=False):
+        """
+        Returns the columns cleaned by `load(columnar=True)`. Numeric columns
+        without missing values are `array.array` instances, others are lists.
+
+        :param as_numpy: Return NumPy arrays, typed by each field’s `numpy_dtype`
+        :return: A dictionary that maps field names to columns
+        """
+        if not as_numpy:
+            return dict(self._columns)
+
+        try:
+            import numpy
+        except ImportError:
+            raise ImproperlyConfigured(
+                "NumPy is required for NumPy columns", hint="pip install numpy"
+            )
 
-        self._validate_unique_fields()
+        columns = {}
+
+        for name, column in self._columns.items():
+            try:
+                columns[name] = numpy.array(
+                    column, dtype=self._fields[name].numpy_dtype
+                )
+            except (TypeError, ValueError):
+                # E.g. integer columns with missing values
+                columns[name] = numpy.array(column, dtype=object)
+
+        return columns
+
+    def get_target_types(self) -> dict:
+        """
+        :return: A dictionary that maps field names to their `target_type`
+        """
+        return {name: field.get_target_type() for name, field in self._fields.items()}
 
     def get_sheet_name(self):
         """
@@ -136,6 +410,17 @@ class BaseSheet(ABC):
         """
         return self.sheet_name
 
+    def get_reader_class(self):
+        """
+        Gets the reader used to read rows from the document
+        :return: A `readers.BaseReader` subclass
+        """
+        if self.reader_class:
+            return self.reader_class
+        if self._workbook is not None:
+            return OpenpyxlReader
+        return get_reader_class(self.path)
+
     def get_header_rows(self):
         """
         Gets the number of header rows
@@ -154,7 +439,27 @@ class BaseSheet(ABC):
 
     @property
     def errors(self):
-        return self._errors
+        """
+        :return: A list of errors as text, in the sheet’s language
+        """
+        return [record.format(self.language) for record in self._errors]
+
+    @property
+    def error_records(self):
+        """
+        :return: A list of errors as `records.Record` instances
+        """
+        return list(self._errors)
+
+    def error_summary(self, language=None):
+        """
+        Groups errors by message and column, e.g.
+        "wrong_type in column “Chart Position”: 40,512 rows"
+
+        :param language: Defaults to the sheet’s language
+        :return: A list of strings, most frequent first
+        """
+        return summarize(self._errors, language or self.language)
 
     @property
     def has_errors(self):
@@ -162,17 +467,34 @@ class BaseSheet(ABC):
 
     @property
     def infos(self):
-        return self._infos
+        """
+        :return: A list of infos as text, in the sheet’s language
+        """
+        return [record.format(self.language) for record in self._infos]
+
+    @property
+    def info_records(self):
+        """
+        :return: A list of infos as `records.Record` instances
+        """
+        return list(self._infos)
 
     @property
     def has_infos(self):
         return len(self._infos) > 0
 
+    @property
+    def stats(self):
+        """
+        :return: The `stats.LoadStats` of the last load, if it was profiled
+        """
+        return self._stats
+
     def __getitem__(self, item):
         if item < 0 or (item > len(self) - 1):
             raise IndexError()
 
-        return self._rows[item]
+        return self.__unpack(self._rows[item])
 
     def __len__(self):
         return len(self._rows)
@@ -193,18 +515,122 @@ class BaseSheet(ABC):
 
         return fields
 
-    def _add_error(self, message, index=None) -> None:
+    def _compile_fields(self, column_map) -> list:
+        """
+        Compiles the fields into a flat plan, so that the work per cell is
+        limited to converting values. Each entry is a tuple of
+        (name, cell index, clean, exact type, default, field). Values of the
+        exact type are taken as they are, which is only done for fields that
+        don’t override `clean`. Defaults are evaluated once per load.
+
+        :param column_map: The column map
+        :return: A list of tuples
+        """
+        plan = []
+
+        for name, field in self._fields.items():
+            exact_type = None
+            if field.cast_type and type(field).clean is BaseField.clean:
+                exact_type = field.get_target_type()
+
+            plan.append(
+                (
+                    name,
+                    column_map.get(field.source),
+                    field.clean,
+                    exact_type,
+                    field.get_default(),
+                    field,
+                )
+            )
+
+        return plan
+
+    def _build_row(self, row_dict, get_extra_data=None) -> dict:
+        """
+        Builds the full row of cleaned values, see `get_extra_data`
+
+        :param row_dict: The cleaned values by field name
+        :param get_extra_data: Called instead of `get_extra_data`, e.g. to time it
+        """
+        # Use extra data as a basis
+        full_dict = (get_extra_data or self.get_extra_data)(row_dict)
+        # And update with “real” data, which takes precedence
+        full_dict.update(row_dict)
+        return full_dict
+
+    def _get_fingerprint(self, extra_context=None) -> str:
+        """
+        Describes everything besides the document, that affects the result of
+        loading it. Used as part of cache keys.
+        """
+        cls = self.__class__
+        parts = [
+            f"{cls.__module__}.{cls.__qualname__}",
+            self.language,
+            self.get_sheet_name(),
+            self.get_header_rows(),
+            self.get_label_row(),
+            self._get_unique_keys(),
+            self.blank_row_threshold,
+            self.max_errors,
+            self.max_consecutive_error_rows,
+            sorted(map(repr, (extra_context or {}).items())),
+        ]
+
+        for name, field in self._fields.items():
+            parts.append((name, field.get_fingerprint()))
+
+        return repr(parts)
+
+    def _reset(self) -> None:
+        """
+        Discards the results of a previous load
+        """
+        self._rows = []
+        self._row_names = None
+        self._columns = {}
+        self._infos = []
+        self._errors = {}
+        self._stats = None
+        self._positions = {}
+        self._row_errors = {}
+        self._unique_index = {}
+        self._unique_errors = {}
+
+    def _prepare(self, field, values, context) -> None:
+        """
+        Lets a field prepare values, awaiting the result if `prepare` is async
+        """
+        result = field.prepare(values, context)
+        if inspect.isawaitable(result):
+            context.resolve([result])
+
+    def _record(self, code, params=None, column=None) -> Record:
+        """
+        Creates a record of a message in the sheet’s language
+        """
+        return Record(code=code, params=params, column=column, language=self.language)
+
+    def _row_number(self, index) -> int:
+        """
+        Converts a row index to the row number shown in spreadsheet applications
+        """
+        return index + 1 + self.get_header_rows()
+
+    def _add_error(self, message, index=None) -> Record:
+        """
+        :param message: A `records.Record` or text
+        :param index: The index of the row the error relates to
+        """
+        if not isinstance(message, Record):
+            message = Record(text=message, language=self.language)
         # Add to row index, if it’s related to a row.
         if isinstance(index, int):
-            message = _(
-                "sheet.row_info",
-                self.language,
-                params={
-                    "row": index + 1 + self.get_header_rows(),
-                    "message": message,
-                },
-            )
-        self._errors.append(message)
+            message.row = self._row_number(index)
+            self._row_errors.setdefault(index, []).append(message)
+        self._errors[message] = None
+        return message
 
     def _add_errors(self, errors) -> None:
         for error in errors:
@@ -219,37 +645,90 @@ class BaseSheet(ABC):
             else:
                 self._add_error(error)
 
-    def _add_info(self, message, index=None) -> None:
+    def _add_info(self, message, index=None, last_index=None) -> Record:
+        """
+        :param message: A `records.Record` or text
+        :param index: The index of the row the info relates to
+        :param last_index: The index of the last row, if the info relates to a range of rows
+        """
+        if not isinstance(message, Record):
+            message = Record(text=message, language=self.language)
         # Add to row index, if it’s related to a row.
         if isinstance(index, int):
-            message = _(
-                "sheet.row_info",
-                self.language,
-                params={
-                    "row": index + 1 + self.get_header_rows(),
-                    "message": message,
-                },
-            )
+            message.row = self._row_number(index)
+        if isinstance(last_index, int):
+            message.last_row = self._row_number(last_index)
         self._infos.append(message)
+        return message
 
-    def _validate_unique_fields(self):
-        for name, field in self._fields.items():
-            if field.unique is True:
-                self._validate_unique_field(name, field.source)
-
-    def _validate_unique_field(self, field_name, column_name):
-        values = list(map(lambda row: row.get(field_name), self._rows))
-        distinct_values = set(values)
-
-        for value in distinct_values:
-            total = values.count(value)
-            if total > 1:
-                msg = _(
-                    "sheet.unique_violation",
-                    self.language,
-                    params={"column": column_name, "value": value, "total": total},
-                )
-                self._add_error(msg)
+    def _get_unique_keys(self) -> list:
+        """
+        Gets the fields whose values must be unique, either on their own or
+        combined, see `unique_together`
+        :return: A list of tuples of field names
+        """
+        keys = [(name,) for name, field in self._fields.items() if field.unique is True]
+        keys.extend(tuple(names) for names in self.unique_together)
+        return keys
+
+    def _build_unique_index(self) -> dict:
+        """
+        Builds an index, that maps each unique key to a dictionary of values
+        and the row indexes they occur in. It’s filled while loading.
+        """
+        return {names: defaultdict(list) for names in self._get_unique_keys()}
+
+    def _update_unique_index(self, unique_index, row, index) -> None:
+        for names, values in unique_index.items():
+            if len(names) == 1:
+                value = row[names[0]]
+            else:
+                value = tuple(row[name] for name in names)
+            values[value].append(index)
+
+    def _validate_unique_fields(self, unique_index):
+        """
+        Adds an error for each value that occurs more than once. The index is
+        kept, so that `revalidate` can update it.
+
+        :param unique_index: The index built while loading
+        """
+        self._unique_index = unique_index
+
+        for names, values in unique_index.items():
+            for value, indexes in values.items():
+                if len(indexes) > 1:
+                    self._add_unique_violation(names, value, indexes)
+
+    def _add_unique_violation(self, names, value, indexes) -> Record:
+        """
+        Adds an error for a value of a unique key, that occurs in several rows
+
+        :param names: The unique key, a tuple of field names
+        :param value: The value, a tuple for several field names
+        :param indexes: The indexes of the rows the value occurs in
+        """
+        columns = [self._fields[name].source for name in names]
+        params = {
+            "value": value,
+            "total": len(indexes),
+            "rows": ", ".join(
+                str(self._row_number(index)) for index in sorted(indexes)
+            ),
+        }
+
+        if len(columns) == 1:
+            params["column"] = columns[0]
+            record = self._record("sheet.unique_violation", params, column=columns[0])
+        else:
+            params["columns"] = ", ".join(columns)
+            params["value"] = ", ".join(str(part) for part in value)
+            record = self._record(
+                "sheet.unique_together_violation", params, column=params["columns"]
+            )
+
+        self._unique_errors[(names, value)] = record
+        return self._add_error(record)
 
     def _check(self) -> None:
         """
@@ -262,13 +741,576 @@ class BaseSheet(ABC):
         if not self.sheet_name:
             raise ImproperlyConfigured("No sheet name set")
 
+        for names in self.unique_together:
+            for name in names:
+                if name not in self._fields:
+                    raise ImproperlyConfigured(
+                        f"“{name}” in unique_together isn’t a field of"
+                        f" {self.__class__.__name__}"
+                    )
+
     #
     # === Private ===
+
+    def __prepares_values(self) -> bool:
+        """
+        Whether a field prepares values, see `BaseField.prepare`
+        """
+        return any(
+            type(field).prepare is not BaseField.prepare
+            for field in self._fields.values()
+        )
+
     #
 
-    def __column_map(self, sheet) -> dict:
+    def __start_reading(self, reader, extra_context, loop=None, max_concurrency=None):
+        """
+        Maps the columns of an opened sheet and starts reading its rows.
+
+        :param reader: A reader with an opened sheet
+        :param extra_context: A dictionary that is passed to the fields
+        :param loop: See `__iter_rows`
+        :param max_concurrency: See `__iter_rows`
+        :return: A tuple of (plan, field context, iterator of rows, `get_extra_data`),
+                 or `None` if columns are missing
+        """
+        with self.__measure("column_map"):
+            column_map = self.__column_map(reader)
+            self.__check_columns_present(column_map)
+
+        if self.has_errors:
+            return None
+
+        column_map, min_col, max_col = self.__column_span(column_map)
+        plan = self._compile_fields(column_map)
+        context = FieldContext(
+            self.language, extra_context, loop=loop, max_concurrency=max_concurrency
+        )
+        min_row = self.get_header_rows() + 1
+        sheet_rows = reader.iter_rows(min_row=min_row, min_col=min_col, max_col=max_col)
+        get_extra_data = self.get_extra_data
+
+        stats = self._stats
+        if stats is not None:
+            sheet_rows = stats.timed_rows(sheet_rows)
+            get_extra_data = stats.timed("extra_data", get_extra_data)
+
+        if min_col is not None:
+            sheet_rows = self.__padded(sheet_rows, max_col - min_col + 1)
+        return plan, context, sheet_rows, get_extra_data
+
+    @staticmethod
+    def __padded(sheet_rows, width):
+        """
+        Read-only sheets may omit trailing empty cells, which are filled in
+        with `None`, so that every row has a cell for each column
+        """
+        for row in sheet_rows:
+            if len(row) < width:
+                row = tuple(row) + (None,) * (width - len(row))
+            yield row
+
+    def __iter_rows(
+        self, reader, extra_context, loop=None, max_concurrency=None, sample_size=None
+    ):
+        """
+        Maps the rows of an opened sheet to dicts.
+
+        :param reader: A reader with an opened sheet
+        :param extra_context: A dictionary that is passed to the fields
+        :param loop: The event loop of an async load, see `FieldContext.resolve`
+        :param max_concurrency: The maximum number of awaitables in flight
+        :param sample_size: Stop after this many rows. Unique fields are only
+                            validated if the sheet has no more rows.
+        :return: A generator of (row dict, list of row errors, row index) tuples
         """
-        Takes a sheet and returns a dictionary, that maps column names to column indexes.
+        reading = self.__start_reading(reader, extra_context, loop, max_concurrency)
+        if reading is None:
+            return
+
+        plan, context, sheet_rows, get_extra_data = reading
+        unique_index = self._build_unique_index()
+        stats = self._stats
+
+        if stats is not None:
+            plan = [
+                (name, cell_index, stats.timed_field(name, clean), *entry)
+                for name, cell_index, clean, *entry in plan
+            ]
+
+        preparing = [
+            (cell_index, field)
+            for _name, cell_index, *_entry, field in plan
+            if type(field).prepare is not BaseField.prepare
+        ]
+        if preparing:
+            sheet_rows = self.__prepare_batches(sheet_rows, preparing, context)
+
+        consecutive_error_rows = 0
+        max_blank_rows = self.blank_row_threshold
+        if max_blank_rows is None:
+            max_blank_rows = float("inf")
+        blank_rows = 0
+        # Whether blank rows are skipped is known once the first one was cleaned
+        skips_blank_rows = False
+        skipped = _SkippedRows()
+
+        # Every row that isn’t skipped as blank right away is handled by all fields
+        cleaned_rows = 0
+        try:
+            for row_index, row_values in enumerate(sheet_rows):
+                blank = row_values.count(None) == len(row_values)
+                if blank and skips_blank_rows:
+                    # Only skipped blank rows count, rows with defaults are kept
+                    blank_rows += 1
+                    if blank_rows > max_blank_rows:
+                        # The rest of the sheet is most likely empty, but formatted
+                        self.__add_skipped_rows(skipped)
+                        self._add_info(
+                            self._record("sheet.blank_tail", {"total": max_blank_rows})
+                        )
+                        break
+                    skipped.add(row_index)
+                    continue
+                elif not blank:
+                    blank_rows = 0
+
+                row_dict = {}
+                error_cache = []
+                cleaned_rows += 1
+                for name, cell_index, clean, exact_type, default, field in plan:
+                    value = row_values[cell_index]
+                    if value is None:
+                        value = default
+                    elif type(value) is exact_type:
+                        # Nothing to convert
+                        row_dict[name] = value
+                        continue
+
+                    try:
+                        field.validate_required(value, context)
+                        row_dict[name] = clean(value, context)
+                    except ValidationException as error:
+                        row_dict[name] = None
+                        record = Record.from_exception(
+                            error, column=field.source, language=self.language
+                        )
+                        error_cache.append((record, row_index))
+
+                # Evaluate before adding extra data
+                if self.shall_skip(row_dict):
+                    if blank and not skips_blank_rows:
+                        skips_blank_rows = True
+                        blank_rows = 1
+                    skipped.add(row_index)
+                    continue
+                elif sample_size is not None and sample_size <= 0:
+                    # There are more rows than the sample, unique values can’t be validated
+                    return
+                else:
+                    if sample_size is not None:
+                        sample_size -= 1
+                    self.__add_skipped_rows(skipped)
+                    self._update_unique_index(unique_index, row_dict, row_index)
+
+                    full_dict = self._build_row(row_dict, get_extra_data)
+                    row_errors = [self._add_error(*error) for error in error_cache]
+                    yield full_dict, row_errors, row_index
+
+                    consecutive_error_rows = (
+                        consecutive_error_rows + 1 if row_errors else 0
+                    )
+                    if self.__exceeds_error_budget(consecutive_error_rows):
+                        # Unique validation is skipped, as not all rows have been read
+                        self._add_error(
+                            self._record("sheet.too_many_errors"), row_index
+                        )
+                        return
+            else:
+                self.__add_skipped_rows(skipped)
+        finally:
+            if stats is not None:
+                for name, *_entry in plan:
+                    stats.count_values(name, cleaned_rows)
+
+        with self.__measure("unique"):
+            self._validate_unique_fields(unique_index)
+
+    async def __aiter_rows(self, extra_context, read_only, max_concurrency):
+        """
+        Reads rows in a thread and passes them to the event loop in batches.
+        The queue is bounded, so reading pauses while the loop is busy.
+
+        :return: An async generator of (row dict, list of row errors, row index) tuples
+        """
+        # Imported here, as it’s only needed for async loads
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=2)
+        stopped = threading.Event()
+
+        def put(item):
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+
+        def produce():
+            try:
+                with self.__open_sheet(extra_context, read_only) as (reader, context):
+                    if reader is None:
+                        return
+                    rows = self.__iter_rows(
+                        reader, context, loop=loop, max_concurrency=max_concurrency
+                    )
+                    try:
+                        while not stopped.is_set():
+                            batch = list(islice(rows, self.batch_size))
+                            if not batch:
+                                break
+                            put(batch)
+                    finally:
+                        rows.close()
+            except BaseException as error:
+                put(error)
+            finally:
+                put(None)
+
+        future = loop.run_in_executor(None, produce)
+
+        try:
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    break
+                if isinstance(batch, BaseException):
+                    raise batch
+
+                await self.__resolve_extra_data(batch, max_concurrency)
+                for entry in batch:
+                    yield entry
+        finally:
+            stopped.set()
+            # Keep draining, so that the thread isn’t blocked and closes the document
+            while not future.done():
+                while not queue.empty():
+                    queue.get_nowait()
+                await asyncio.wait([future], timeout=0.01)
+
+    async def __resolve_extra_data(self, batch, max_concurrency) -> None:
+        """
+        Awaits the results of async extra data callables of a batch of rows
+        """
+        pending = [
+            (row, key, value)
+            for row, _row_errors, _row_index in batch
+            for key, value in row.items()
+            if inspect.isawaitable(value)
+        ]
+        if not pending:
+            return
+
+        results = await aio.gather(
+            [value for _row, _key, value in pending], limit=max_concurrency
+        )
+        for (row, key, _value), result in zip(pending, results):
+            row[key] = result
+
+    def __add_skipped_rows(self, skipped) -> None:
+        """
+        Adds an info for the pending range of skipped rows, if there is one
+        """
+        if skipped.first is None:
+            return
+
+        record = self._record("sheet.skipped_row")
+        self._add_info(record, index=skipped.first, last_index=skipped.last)
+        skipped.clear()
+
+    def __pack(self, row):
+        """
+        Converts a row dict to the way rows are stored, see `compact_rows`
+        """
+        if not self.compact_rows:
+            return row
+
+        names = self._row_names
+        if names is None:
+            names = self._row_names = tuple(row)
+
+        if len(row) != len(names):
+            # E.g. extra data with differing keys, keep the dict
+            return row
+        try:
+            return tuple(map(row.__getitem__, names))
+        except KeyError:
+            return row
+
+    def __unpack(self, row) -> dict:
+        if type(row) is tuple:
+            return dict(zip(self._row_names, row))
+        return row
+
+    def __row_dicts(self):
+        for row in self._rows:
+            yield self.__unpack(row)
+
+    def __discard_row_errors(self, row_index, column) -> None:
+        """
+        Removes the errors of a cell
+        """
+        records = self._row_errors.get(row_index)
+        if not records:
+            return
+
+        kept = []
+        for record in records:
+            if record.column == column:
+                del self._errors[record]
+            else:
+                kept.append(record)
+        self._row_errors[row_index] = kept
+
+    def __unique_value(self, row, names):
+        if len(names) == 1:
+            return row[names[0]]
+        return tuple(row[name] for name in names)
+
+    def __move_unique_value(self, names, row_index, old_value, new_value) -> None:
+        """
+        Moves a row to another value in the unique index and updates the
+        violations of both values
+        """
+        values = self._unique_index[names]
+
+        indexes = values[old_value]
+        indexes.remove(row_index)
+        if not indexes:
+            del values[old_value]
+        values[new_value].append(row_index)
+
+        for value in (old_value, new_value):
+            record = self._unique_errors.pop((names, value), None)
+            if record is not None:
+                del self._errors[record]
+
+            indexes = values.get(value, ())
+            if len(indexes) > 1:
+                self._add_unique_violation(names, value, indexes)
+
+    def __exceeds_error_budget(self, consecutive_error_rows) -> bool:
+        if self.max_errors is not None and len(self._errors) >= self.max_errors:
+            return True
+
+        max_rows = self.max_consecutive_error_rows
+        return max_rows is not None and consecutive_error_rows >= max_rows
+
+    def __load_columns(self, reader, extra_context) -> None:
+        """
+        Gathers the values of each column, cleans them column by column and
+        assembles the row dicts afterwards.
+
+        :param reader: A reader with an opened sheet
+        :param extra_context: A dictionary that is passed to the fields
+        """
+        reading = self.__start_reading(reader, extra_context)
+        if reading is None:
+            return
+
+        plan, context, sheet_rows, get_extra_data = reading
+        sheet_rows = list(sheet_rows)
+        stats = self._stats
+
+        names = []
+        cleaned_columns = []
+        errors = []
+
+        for position, (name, cell_index, *_entry, field) in enumerate(plan):
+            values = [row[cell_index] for row in sheet_rows]
+            clean_column = field.clean_column
+            if stats is not None:
+                clean_column = stats.timed_field(name, clean_column)
+                stats.count_values(name, len(values))
+
+            with self.__measure("prepare"):
+                self._prepare(field, values, context)
+            cleaned, column_errors = clean_column(values, context)
+            names.append(name)
+            cleaned_columns.append(cleaned)
+            errors.extend(
+                (row_index, position, error, field.source)
+                for row_index, error in column_errors
+            )
+
+        del sheet_rows
+        kept = []
+        skipped = _SkippedRows()
+
+        for row_index, row_values in enumerate(zip(*cleaned_columns)):
+            row_dict = dict(zip(names, row_values))
+
+            # Evaluate before adding extra data
+            if self.shall_skip(row_dict):
+                skipped.add(row_index)
+                continue
+
+            self.__add_skipped_rows(skipped)
+            self._positions[row_index] = len(kept)
+            kept.append(row_index)
+            full_dict = self._build_row(row_dict, get_extra_data)
+            self._rows.append(self.__pack(full_dict))
+
+        self.__add_skipped_rows(skipped)
+
+        # Report errors row by row, like a regular load does
+        kept_indexes = set(kept)
+        for row_index, _position, error, source in sorted(
+            errors, key=lambda error: error[:2]
+        ):
+            if row_index in kept_indexes:
+                record = Record.from_exception(
+                    error, column=source, language=self.language
+                )
+                self._add_error(record, row_index)
+
+        for name, column in zip(names, cleaned_columns):
+            if len(kept) < len(column):
+                column = self.__select(column, kept)
+            self._columns[name] = column
+
+        with self.__measure("unique"):
+            unique_index = self._build_unique_index()
+            for row_index, row in zip(kept, self.__row_dicts()):
+                self._update_unique_index(unique_index, row, row_index)
+            self._validate_unique_fields(unique_index)
+
+    def __prepare_batches(self, sheet_rows, preparing, context):
+        """
+        Reads rows in batches of `batch_size` and lets fields prepare the
+        values of each batch, before its rows are yielded.
+
+        :param sheet_rows: An iterator of tuples of cell values
+        :param preparing: A list of (cell index, field) tuples
+        :param context: The field context
+        """
+        while True:
+            batch = list(islice(sheet_rows, self.batch_size))
+            if not batch:
+                return
+
+            with self.__measure("prepare"):
+                for cell_index, field in preparing:
+                    values = [row[cell_index] for row in batch]
+                    self._prepare(field, values, context)
+
+            yield from batch
+
+    def __result(self) -> dict:
+        """
+        Describes the loaded state for the result cache. Rows are stored
+        without extra data, which is added again when restoring them.
+        """
+        names = list(self._fields.keys())
+        return {
+            "names": names,
+            "rows": [tuple(row[name] for name in names) for row in self.__row_dicts()],
+            "positions": self._positions,
+            "errors": list(self._errors),
+            "infos": list(self._infos),
+        }
+
+    def __restore(self, result) -> bool:
+        """
+        Restores the state stored by `__result`
+        :return: Whether there was a result to restore
+        """
+        if result is None:
+            return False
+
+        self._reset()
+        names = result["names"]
+
+        for values in result["rows"]:
+            row_dict = dict(zip(names, values))
+            self._rows.append(self.__pack(self._build_row(row_dict)))
+
+        self._positions.update(result.get("positions", {}))
+        self._infos.extend(result["infos"])
+
+        # Unique violations are added again along with the index
+        unique_index = self._build_unique_index()
+        for row_index, position in self._positions.items():
+            self._update_unique_index(unique_index, self[position], row_index)
+
+        for record in result["errors"]:
+            if record.code in UNIQUE_VIOLATION_CODES:
+                continue
+            if record.row is None:
+                self._add_error(record)
+            else:
+                self._add_error(record, record.row - 1 - self.get_header_rows())
+
+        self._validate_unique_fields(unique_index)
+        return True
+
+    @staticmethod
+    def __select(column, indexes):
+        """
+        Selects the values at the given indexes, keeping arrays as arrays
+        """
+        values = [column[index] for index in indexes]
+        if isinstance(column, array):
+            return array(column.typecode, values)
+        return values
+
+    @contextmanager
+    def __open_sheet(self, extra_context, read_only, stats=None):
+        """
+        Resets the sheet, opens the document and closes it again when done.
+        The reader is `None`, when the sheet couldn’t be opened.
+
+        :return: A tuple of (reader, extra context)
+        """
+        if extra_context is None:
+            extra_context = {}
+
+        if read_only is None:
+            read_only = self.read_only
+
+        if stats is None and self.profile:
+            stats = LoadStats()
+
+        self._reset()
+        self._stats = stats
+
+        if stats is not None:
+            stats.start()
+
+        try:
+            with self.__measure("open"):
+                reader = self.__get_reader(read_only=read_only)
+
+            if self.has_errors:
+                yield None, extra_context
+                return
+
+            try:
+                yield reader, extra_context
+            finally:
+                reader.close()
+        finally:
+            if stats is not None:
+                stats.finish()
+
+    def __measure(self, phase):
+        """
+        Measures the time of a block of code, if the load is profiled
+        """
+        if self._stats is None:
+            return nullcontext()
+        return self._stats.measure(phase)
+
+    def __column_map(self, reader) -> dict:
+        """
+        Takes a reader and returns a dictionary, that maps column names to column indexes.
 
         Example:
         ```
@@ -279,21 +1321,43 @@ class BaseSheet(ABC):
         }
         ```
 
-        :param sheet: Worksheet from openpyxl
+        :param reader: A reader with an opened sheet
         :return: A dictionary that maps column names to indexes
         """
         column_map = {}
-        label_row = self.get_label_row()
+        # Row 0 is treated as the first row
+        label_row = self.get_label_row() or 1
+        # Only read the label row, which also works for read-only sheets
+        labels = next(reader.iter_rows(min_row=label_row, max_row=label_row), ())
 
-        for index, column in enumerate(
-            sheet.iter_cols(0, sheet.max_column, min_row=label_row, max_row=label_row)
-        ):
+        for index, label in enumerate(labels):
             # Retrieve and sanitize the column name from a header cell
-            key = str(column[0].value).strip()
+            key = str(label).strip()
             column_map[key] = index
 
         return column_map
 
+    def __column_span(self, column_map):
+        """
+        Works out the span of columns the fields use, so that only those
+        cells are read, however wide the sheet is.
+
+        :param column_map: The column map
+        :return: A tuple of (column map relative to the span, first column, last column).
+                 Columns are one based, like in spreadsheet applications.
+        """
+        indexes = [column_map[field.source] for field in self._fields.values()]
+        if not indexes:
+            return column_map, None, None
+
+        first, last = min(indexes), max(indexes)
+        span_map = {
+            label: index - first
+            for label, index in column_map.items()
+            if first <= index <= last
+        }
+        return span_map, first + 1, last + 1
+
     def __check_columns_present(self, column_map) -> None:
         """
         Checks whether the columns (described by the source attribute of fields) are present.
@@ -306,15 +1370,45 @@ class BaseSheet(ABC):
 
         for field in used_fields:
             if field not in all_fields:
-                msg = _("sheet.column_missing", self.language, params={"column": field})
-                self._add_error(msg)
+                self._add_error(
+                    self._record(
+                        "sheet.column_missing", {"column": field}, column=field
+                    )
+                )
 
-    def __get_sheet(self):
-        wb = load_workbook(filename=self.path, data_only=True)
+    def __get_reader(self, read_only=False):
+        reader_class = self.get_reader_class()
+        if issubclass(reader_class, OpenpyxlReader):
+            reader = reader_class(
+                self.path, read_only=read_only, workbook=self._workbook
+            )
+        else:
+            reader = reader_class(self.path, read_only=read_only)
         sheet_name = self.get_sheet_name()
 
         try:
-            return wb[sheet_name]
+            reader.open(sheet_name)
+            return reader
         except KeyError:
-            msg = _("sheet.sheet_missing", self.language, params={"sheet": sheet_name})
-            self._add_error(msg)
+            reader.close()
+            self._add_error(self._record("sheet.sheet_missing", {"sheet": sheet_name}))
+
+
+class _SkippedRows:
+    """
+    A range of consecutive skipped rows, so that they’re reported at once
+    """
+
+    __slots__ = ("first", "last")
+
+    def __init__(self):
+        self.clear()
+
+    def add(self, index) -> None:
+        if self.first is None:
+            self.first = index
+        self.last = index
+
+    def clear(self) -> None:
+        self.first = None
+        self.last = None
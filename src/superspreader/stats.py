@@ -0,0 +1,177 @@
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class FieldStats:
+    """
+    Cumulative time spent cleaning the values of a field
+
+    - `values`: The number of values the field handled
+    - `calls`: The number of calls to `clean`, or to `clean_column` in
+      columnar loads. Values that already have the target type are taken as
+      they are, without calling `clean`.
+    - `seconds`: The time spent in those calls
+    """
+
+    def __init__(self):
+        self.values = 0
+        self.calls = 0
+        self.seconds = 0.0
+
+    def as_dict(self) -> dict:
+        return {"values": self.values, "calls": self.calls, "seconds": self.seconds}
+
+    def __repr__(self):
+        return f"<FieldStats values={self.values} calls={self.calls} seconds={self.seconds:.6f}>"
+
+
+class LoadStats:
+    """
+    Records where the time of a load goes. Pass an instance to
+    `BaseSheet.load` or set `profile = True` on the sheet, and read it from
+    `BaseSheet.stats` afterwards.
+
+    Phases are:
+
+    - `open`: Opening the document and the sheet
+    - `column_map`: Reading the label row and checking columns
+    - `read`: Reading rows from the document
+    - `prepare`: Preparing batches of values, see `BaseField.prepare`
+    - `clean`: Cleaning values, broken down per field in `fields`
+    - `extra_data`: Calling `get_extra_data`
+    - `unique`: Validating unique fields
+
+    Phases overlap with `total`, which is the wall time of the whole load.
+    """
+
+    def __init__(self, callbacks=None, trace_memory=False):
+        """
+        :param callbacks: Callables that are called with the stats once a load
+                          has finished, e.g. to ship them to a metrics system
+        :param bool trace_memory: Record the peak memory allocated while
+                                  loading, using `tracemalloc`. Slows loading down.
+        """
+        self.callbacks = list(callbacks or [])
+        self.trace_memory = trace_memory
+        self.phases = {}
+        self.fields = {}
+        self.rows = 0
+        self.total = 0.0
+        self.peak_memory = None
+
+        self._started_at = None
+        self._started_tracing = False
+
+    @property
+    def rows_per_second(self):
+        if not self.total:
+            return None
+        return self.rows / self.total
+
+    def start(self) -> None:
+        self._started_at = time.perf_counter()
+
+        if self.trace_memory:
+            if tracemalloc.is_tracing():
+                # Available as of Python 3.9
+                if hasattr(tracemalloc, "reset_peak"):
+                    tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                self._started_tracing = True
+
+    def finish(self) -> None:
+        self.total = time.perf_counter() - self._started_at
+
+        if self.trace_memory:
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+        for callback in self.callbacks:
+            callback(self)
+
+    def add_time(self, phase, seconds) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def measure(self, phase):
+        """
+        Measures the time of a block of code
+        """
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(phase, time.perf_counter() - started_at)
+
+    def timed(self, phase, func):
+        """
+        Wraps a function, so that its time is added to a phase
+        """
+
+        def wrapper(*args, **kwargs):
+            started_at = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add_time(phase, time.perf_counter() - started_at)
+
+        return wrapper
+
+    def timed_field(self, name, func):
+        """
+        Wraps the `clean` method of a field, so its calls and time are recorded
+        """
+        field_stats = self.fields.setdefault(name, FieldStats())
+
+        def wrapper(*args, **kwargs):
+            started_at = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                seconds = time.perf_counter() - started_at
+                field_stats.calls += 1
+                field_stats.seconds += seconds
+                self.add_time("clean", seconds)
+
+        return wrapper
+
+    def count_values(self, name, count) -> None:
+        """
+        Adds to the number of values a field handled
+        """
+        self.fields.setdefault(name, FieldStats()).values += count
+
+    def timed_rows(self, rows):
+        """
+        Wraps an iterator of rows, counting them and adding the time spent
+        reading them to the `read` phase
+        """
+        rows = iter(rows)
+
+        while True:
+            started_at = time.perf_counter()
+            try:
+                row = next(rows)
+            except StopIteration:
+                self.add_time("read", time.perf_counter() - started_at)
+                return
+            self.add_time("read", time.perf_counter() - started_at)
+            self.rows += 1
+            yield row
+
+    def as_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "rows": self.rows,
+            "rows_per_second": self.rows_per_second,
+            "peak_memory": self.peak_memory,
+            "phases": dict(self.phases),
+            "fields": {name: stats.as_dict() for name, stats in self.fields.items()},
+        }
+
+    def __repr__(self):
+        return f"<LoadStats rows={self.rows} total={self.total:.6f}>"
@@ -0,0 +1,174 @@
+from collections.abc import Mapping, Sequence
+
+
+class Projection:
+    """
+    Describes which keys of rows are visible and how they’re named. It’s
+    shared by all views of a call to `BaseSheet.rows`.
+    """
+
+    __slots__ = ("include", "exclude", "rename", "renamed_from", "positions")
+
+    def __init__(self, include=None, exclude=None, rename=None, names=None, keys=None):
+        """
+        :param include: Iterable of keys to include, all keys when `None`
+        :param exclude: Iterable of keys to exclude
+        :param dict rename: Maps keys to the names they’re shown as
+        :param names: The keys shared by compact rows, see `BaseSheet.compact_rows`
+        :param keys: The keys of the rows, if known. Defaults to `names`.
+        :raises ValueError: If a key is renamed to the name of another visible key
+        """
+        self.include = tuple(include) if include is not None else None
+        self.exclude = frozenset(exclude or ())
+        self.rename = dict(rename or {})
+        self.renamed_from = {new: old for old, new in self.rename.items()}
+        self.positions = (
+            {name: index for index, name in enumerate(names)}
+            if names is not None
+            else {}
+        )
+        self.__check_rename(keys if keys is not None else names)
+
+    @property
+    def is_identity(self):
+        return self.include is None and not self.exclude and not self.rename
+
+    def allows(self, key) -> bool:
+        if self.include is not None and key not in self.include:
+            return False
+        return key not in self.exclude
+
+    def keys_of(self, row):
+        """
+        :return: The keys of a stored row, before renaming
+        """
+        if type(row) is tuple:
+            return self.positions
+        return row
+
+    def lookup(self, row, key):
+        """
+        :raises KeyError: If the stored row doesn’t have the key
+        """
+        if type(row) is tuple:
+            return row[self.positions[key]]
+        return row[key]
+
+    def to_dict(self, row) -> dict:
+        """
+        :return: A new dict with the visible keys of a stored row
+        """
+        if self.is_identity:
+            if type(row) is tuple:
+                return dict(zip(self.positions, row))
+            return row.copy()
+        return dict(RowView(row, self))
+
+    # === Private ===
+
+    def __check_rename(self, keys) -> None:
+        """
+        Checks whether renamed keys would hide other keys. When the keys of
+        the rows aren’t known, only included and renamed keys are checked.
+        """
+        if not self.rename:
+            return
+
+        if keys is None:
+            keys = [*(self.include or ()), *self.rename]
+        shown = {}
+        for key in dict.fromkeys(keys):
+            if not self.allows(key):
+                continue
+            name = self.rename.get(key, key)
+            if name in shown:
+                renamed = key if key in self.rename else shown[name]
+                raise ValueError(
+                    f"Can’t rename “{renamed}” to “{name}”, another key is shown as “{name}”"
+                )
+            shown[name] = key
+
+
+class RowView(Mapping):
+    """
+    A read-only view of a row, that neither copies nor changes the row
+    """
+
+    __slots__ = ("_row", "_projection")
+
+    def __init__(self, row, projection):
+        self._row = row
+        self._projection = projection
+
+    def __getitem__(self, key):
+        projection = self._projection
+        source = projection.renamed_from.get(key)
+        if source is None:
+            if key in projection.rename:
+                # Only visible by its new name
+                raise KeyError(key)
+            source = key
+
+        if not projection.allows(source):
+            raise KeyError(key)
+        return projection.lookup(self._row, source)
+
+    def __iter__(self):
+        projection = self._projection
+        keys = projection.keys_of(self._row)
+
+        if projection.include is not None:
+            keys = [key for key in projection.include if key in keys]
+
+        for key in keys:
+            if key not in projection.exclude:
+                yield projection.rename.get(key, key)
+
+    def __len__(self):
+        return sum(1 for _key in self)
+
+    def copy(self) -> dict:
+        """
+        :return: An independent dict of the row
+        """
+        return self._projection.to_dict(self._row)
+
+    def __repr__(self):
+        # Shown like a dict, e.g. when printing rows
+        return repr(dict(self))
+
+
+class RowsView(Sequence):
+    """
+    A read-only sequence of `RowView`, see `BaseSheet.rows`
+    """
+
+    __slots__ = ("_rows", "_projection")
+
+    def __init__(self, rows, projection):
+        self._rows = rows
+        self._projection = projection
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RowsView(self._rows[index], self._projection)
+        return RowView(self._rows[index], self._projection)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            row == other_row for row, other_row in zip(self, other)
+        )
+
+    def copy(self) -> list:
+        """
+        :return: A list of independent dicts
+        """
+        return [self._projection.to_dict(row) for row in self._rows]
+
+    def __repr__(self):
+        return f"<RowsView of {len(self)} rows>"
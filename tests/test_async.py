@@ -0,0 +1,116 @@
+import asyncio
+import os
+import unittest
+from pathlib import Path
+
+from superspreader import fields
+from superspreader.sheets import BaseSheet
+
+
+def file_path(file_name):
+    tests_dir = Path(__file__).parent.absolute()
+    path = os.path.join(tests_dir, "spreadsheets", file_name)
+    return path
+
+
+class AlbumSheet(BaseSheet):
+    sheet_name = "Albums"
+    header_rows = 3
+    label_row = 2
+
+    artist = fields.CharField(source="Artist")
+    album = fields.CharField(source="Album")
+    chart_position = fields.IntegerField(source="Chart Position")
+
+
+class InFlight:
+    """
+    An async callable that records how many calls run at the same time
+    """
+
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+
+    async def __call__(self, value):
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.current -= 1
+        return value
+
+
+async def collect(rows):
+    return [row async for row in rows]
+
+
+class AsyncLoadTestCase(unittest.TestCase):
+    def test_aiter_load(self):
+        sheet = AlbumSheet(file_path("albums_with_errors.xlsx"))
+        rows = asyncio.run(collect(sheet.aiter_load()))
+
+        expected = list(AlbumSheet(file_path("albums_with_errors.xlsx")).iter_load())
+        self.assertEqual(
+            [(row, [str(error) for error in errors]) for row, errors in rows],
+            [(row, [str(error) for error in errors]) for row, errors in expected],
+        )
+        self.assertEqual(sheet.errors, ["Row 7: “Album” is required"])
+
+    def test_aload(self):
+        sheet = AlbumSheet(file_path("albums.xlsx"))
+        asyncio.run(sheet.aload())
+
+        self.assertEqual(len(sheet), 3)
+        self.assertEqual(sheet[0]["album"], "Toy")
+        self.assertEqual(sheet.infos, ["Row 6: Skipped row"])
+
+    def test_async_extra_data(self):
+        in_flight = InFlight()
+
+        async def chart_label(row):
+            return await in_flight(f"#{row['chart_position']}")
+
+        sheet = AlbumSheet(file_path("albums.xlsx"), extra_data={"label": chart_label})
+        asyncio.run(sheet.aload(max_concurrency=2))
+
+        self.assertEqual([row["label"] for row in sheet], ["#5", "#7", "#30"])
+        self.assertEqual(in_flight.peak, 2)
+
+    def test_async_lookup(self):
+        in_flight = InFlight()
+
+        async def lookup(names):
+            return [(name, await in_flight(name.upper())) for name in names]
+
+        class ArtistSheet(BaseSheet):
+            sheet_name = "Albums"
+            header_rows = 3
+            label_row = 2
+
+            artist = fields.RelatedField(source="Artist", lookup=lookup, chunk_size=1)
+
+        sheet = ArtistSheet(file_path("albums.xlsx"))
+        asyncio.run(sheet.aload(max_concurrency=2))
+        self.assertEqual(sheet[0]["artist"], "DAVID BOWIE")
+        self.assertEqual(in_flight.peak, 2)
+
+        # Async lookups work with regular loads as well
+        sheet = ArtistSheet(file_path("albums.xlsx"))
+        sheet.load()
+        self.assertEqual(sheet[2]["artist"], "KOKOROKO")
+
+    def test_break(self):
+        """Tests whether the document is closed, when iteration stops early"""
+
+        async def first_row():
+            rows = sheet.aiter_load(read_only=True)
+            async for row, _row_errors in rows:
+                await rows.aclose()
+                return row
+
+        sheet = AlbumSheet(file_path("albums.xlsx"))
+        sheet.batch_size = 1
+        row = asyncio.run(first_row())
+        self.assertEqual(row["album"], "Toy")
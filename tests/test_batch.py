@@ -0,0 +1,67 @@
+import os
+import unittest
+from pathlib import Path
+
+from superspreader import fields
+from superspreader.batch import load_many
+from superspreader.sheets import BaseSheet
+
+
+def file_path(file_name):
+    tests_dir = Path(__file__).parent.absolute()
+    path = os.path.join(tests_dir, "spreadsheets", file_name)
+    return path
+
+
+class AlbumSheet(BaseSheet):
+    sheet_name = "Albums"
+    header_rows = 3
+    label_row = 2
+
+    artist = fields.CharField(source="Artist")
+    album = fields.CharField(source="Album")
+    release_date = fields.DateField(source="Release Date")
+    average_review = fields.FloatField(source="Average Review")
+    chart_position = fields.IntegerField(source="Chart Position")
+
+
+class ContactSheet(BaseSheet):
+    sheet_name = "Contacts"
+
+    id = fields.CharField(source="ID", unique=True)
+    name = fields.CharField(source="Name")
+
+
+class LoadManyTestCase(unittest.TestCase):
+    def test_load_many(self):
+        results = load_many(
+            [
+                (AlbumSheet, file_path("albums.xlsx")),
+                (AlbumSheet, file_path("does_not_exist.xlsx")),
+                (AlbumSheet, file_path("albums_with_errors.xlsx")),
+                (ContactSheet, file_path("contacts_duplicates.xlsx")),
+            ],
+            max_workers=2,
+        )
+
+        albums, missing, albums_with_errors, contacts = results
+
+        self.assertFalse(albums.has_errors)
+        self.assertEqual(len(albums.rows), 3)
+        self.assertEqual(albums.infos, ["Row 6: Skipped row"])
+
+        self.assertTrue(missing.failed)
+        self.assertIn("FileNotFoundError", missing.exception)
+
+        self.assertEqual(albums_with_errors.errors[0], "Row 7: “Album” is required")
+        self.assertEqual(len(contacts.errors), 1)
+
+    def test_load_kwargs(self):
+        (result,) = load_many(
+            [(AlbumSheet, file_path("albums.xlsx"))],
+            max_workers=1,
+            extra_data={"status": "released"},
+            read_only=True,
+        )
+
+        self.assertEqual(result.rows[0]["status"], "released")
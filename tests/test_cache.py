@@ -0,0 +1,145 @@
+import datetime
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from superspreader import fields, readers
+from superspreader.cache import ResultCache
+from superspreader.sheets import BaseSheet
+
+
+def file_path(file_name):
+    tests_dir = Path(__file__).parent.absolute()
+    path = os.path.join(tests_dir, "spreadsheets", file_name)
+    return path
+
+
+class AlbumSheet(BaseSheet):
+    sheet_name = "Albums"
+    header_rows = 3
+    label_row = 2
+
+    artist = fields.CharField(source="Artist")
+    album = fields.CharField(source="Album")
+    release_date = fields.DateField(source="Release Date")
+
+
+class ResultCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.cache = ResultCache(self.directory)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def load(self, path, **kwargs):
+        sheet = AlbumSheet(path, **kwargs)
+        sheet.result_cache = self.cache
+        sheet.load()
+        return sheet
+
+    def test_cached_load(self):
+        path = file_path("albums_with_errors.xlsx")
+        sheet = self.load(path)
+
+        with patch.object(readers, "load_workbook") as load_workbook:
+            cached_sheet = self.load(path)
+
+        load_workbook.assert_not_called()
+        self.assertEqual(cached_sheet.rows(), sheet.rows())
+        self.assertEqual(cached_sheet.errors, sheet.errors)
+        self.assertEqual(cached_sheet.infos, sheet.infos)
+
+    def test_extra_data(self):
+        """Tests whether extra data is added to cached rows again"""
+        path = file_path("albums.xlsx")
+        self.load(path)
+        sheet = self.load(path, extra_data={"summary": lambda row: row["album"]})
+
+        self.assertEqual(sheet[0]["summary"], "Toy")
+
+    def test_key(self):
+        path = file_path("albums.xlsx")
+        sheet = AlbumSheet(path)
+        key = self.cache.make_key(path, sheet._get_fingerprint())
+
+        other_file = self.cache.make_key(
+            file_path("albums_with_errors.xlsx"), sheet._get_fingerprint()
+        )
+        other_language = self.cache.make_key(
+            path, AlbumSheet(path, language="de")._get_fingerprint()
+        )
+
+        self.assertNotEqual(key, other_file)
+        self.assertNotEqual(key, other_language)
+
+    def test_error_budget(self):
+        """Tests whether loads stopped by an error budget aren’t served to other sheets"""
+
+        class ChartSheet(AlbumSheet):
+            chart_position = fields.IntegerField(source="Chart Position")
+
+        path = file_path("albums_shifted.xlsx")
+        sheet = ChartSheet(path)
+        sheet.result_cache = self.cache
+        sheet.max_errors = 1
+        sheet.load()
+        self.assertEqual(len(sheet), 1)
+
+        sheet = ChartSheet(path)
+        sheet.result_cache = self.cache
+        sheet.load()
+        self.assertEqual(len(sheet), 21)
+
+    def test_field_configuration(self):
+        """Tests whether changing a field’s configuration invalidates cached results"""
+
+        def date_sheet(formats):
+            class DateSheet(BaseSheet):
+                sheet_name = "Dates"
+                released = fields.DateField(source="Released", formats=formats)
+
+            sheet = DateSheet(path)
+            sheet.result_cache = self.cache
+            sheet.load()
+            return sheet
+
+        path = os.path.join(self.directory, "dates.csv")
+        with open(path, "w", encoding="utf-8") as fp:
+            fp.write("Released\n01/02/2022\n")
+
+        self.assertEqual(len(date_sheet(["%Y/%m/%d"])), 0)
+        sheet = date_sheet(["%m/%d/%Y"])
+        self.assertEqual(sheet[0]["released"], datetime.date(2022, 1, 2))
+
+    def test_field_fingerprint(self):
+        def lookup(names):
+            return []
+
+        field = fields.RelatedField(source="Artist", lookup=lookup)
+        # Stays the same across processes
+        self.assertNotIn(" at 0x", field.get_fingerprint())
+        self.assertEqual(
+            field.get_fingerprint(),
+            fields.RelatedField(source="Artist", lookup=lookup).get_fingerprint(),
+        )
+        self.assertNotEqual(
+            field.get_fingerprint(),
+            fields.RelatedField(
+                source="Artist", lookup=lookup, chunk_size=10
+            ).get_fingerprint(),
+        )
+
+    def test_eviction(self):
+        cache = ResultCache(self.directory, max_size=400)
+        cache.set("first", list(range(100)))
+        cache.set("second", list(range(100)))
+        # Setting the timestamp explicitly, as file systems may be coarse
+        os.utime(os.path.join(self.directory, "first.cache"), (0, 0))
+        cache.set("third", list(range(100)))
+
+        self.assertIsNone(cache.get("first"))
+        self.assertEqual(cache.get("third"), list(range(100)))
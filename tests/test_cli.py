@@ -0,0 +1,97 @@
+import io
+import json
+import os
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+from superspreader import cli
+
+SHEET = "tests.test_batch:AlbumSheet"
+
+
+def file_path(file_name):
+    tests_dir = Path(__file__).parent.absolute()
+    path = os.path.join(tests_dir, "spreadsheets", file_name)
+    return path
+
+
+def run(*argv):
+    stdout = io.StringIO()
+    with redirect_stdout(stdout):
+        exit_code = cli.main([*argv, "--workers", "1"])
+    return exit_code, stdout.getvalue()
+
+
+class CommandLineTestCase(unittest.TestCase):
+    def test_valid(self):
+        exit_code, output = run(SHEET, file_path("albums.xlsx"))
+        entries = [json.loads(line) for line in output.splitlines()]
+
+        self.assertEqual(exit_code, cli.EXIT_OK)
+        self.assertEqual(len(entries), 1)
+        self.assertTrue(entries[0]["valid"])
+        self.assertEqual(entries[0]["infos"], ["Row 6: Skipped row"])
+
+    def test_invalid(self):
+        exit_code, output = run(
+            SHEET, file_path("albums.xlsx"), file_path("albums_with_errors.xlsx")
+        )
+        entries = [json.loads(line) for line in output.splitlines()]
+
+        self.assertEqual(exit_code, cli.EXIT_INVALID)
+        self.assertEqual(
+            [entry["valid"] for entry in entries],
+            [True, False],
+        )
+        self.assertEqual(entries[1]["errors"], ["Row 7: “Album” is required"])
+
+    def test_json(self):
+        pattern = os.path.join(
+            os.path.dirname(file_path("albums.xlsx")), "albums*.xlsx"
+        )
+        exit_code, output = run(SHEET, pattern, "--format", "json", "--sample", "2")
+        document = json.loads(output)
+
+        self.assertEqual(exit_code, cli.EXIT_INVALID)
+        self.assertFalse(document["valid"])
+        paths = [entry["path"] for entry in document["results"]]
+        self.assertIn(file_path("albums.xlsx"), paths)
+        self.assertEqual(paths, sorted(paths))
+
+    def test_structure_only(self):
+        # No rows are cleaned, so the row with errors isn’t read
+        exit_code, output = run(
+            SHEET, file_path("albums_with_errors.xlsx"), "--sample", "0"
+        )
+
+        self.assertEqual(exit_code, cli.EXIT_OK)
+        self.assertTrue(json.loads(output)["valid"])
+
+    def test_missing_document(self):
+        exit_code, output = run(SHEET, file_path("does_not_exist.xlsx"))
+        entry = json.loads(output)
+
+        self.assertEqual(exit_code, cli.EXIT_FAILED)
+        self.assertIn("FileNotFoundError", entry["exception"])
+
+    def test_usage_errors(self):
+        for argv in (
+            ["tests.test_batch"],
+            ["tests.test_batch:Missing"],
+            ["missing:Sheet"],
+            [SHEET, "--workers", "0"],
+            [SHEET, "--workers", "-2"],
+            [SHEET, "--sample", "-1"],
+            [SHEET, "--sample", "many"],
+        ):
+            with self.subTest(argv=argv), redirect_stderr(io.StringIO()):
+                with self.assertRaises(SystemExit) as context:
+                    cli.main([*argv, file_path("albums.xlsx")])
+                self.assertEqual(context.exception.code, cli.EXIT_USAGE)
+
+    def test_expand_paths(self):
+        paths = cli.expand_paths(
+            [file_path("albums.xlsx"), file_path("albums.x*"), file_path("missing.*")]
+        )
+        self.assertEqual(paths, [file_path("albums.xlsx")])
@@ -0,0 +1,80 @@
+import os
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from superspreader import fields
+from superspreader.batch import load_many
+from superspreader.i18n import DE, EN
+from superspreader.sheets import BaseSheet
+
+
+def file_path(file_name):
+    tests_dir = Path(__file__).parent.absolute()
+    path = os.path.join(tests_dir, "spreadsheets", file_name)
+    return path
+
+
+class ContextField(fields.CharField):
+    """
+    Prefixes values with the extra context’s `prefix`
+    """
+
+    def clean(self, value, context=None):
+        value = super().clean(value, context)
+        # Give other threads a chance to interfere
+        time.sleep(0)
+        return f"{context.extra_context['prefix']}:{value}"
+
+
+class AlbumSheet(BaseSheet):
+    sheet_name = "Albums"
+    header_rows = 3
+    label_row = 2
+
+    artist = ContextField(source="Artist")
+    album = fields.CharField(source="Album")
+
+
+class ConcurrencyTestCase(unittest.TestCase):
+    def test_concurrent_loads(self):
+        """
+        Tests whether concurrent loads of the same sheet class keep their
+        context and language apart
+        """
+        barrier = threading.Barrier(8)
+
+        def load(number):
+            language = DE if number % 2 else EN
+            sheet = AlbumSheet(file_path("albums_with_errors.xlsx"), language=language)
+            barrier.wait()
+            results = []
+            for _ in range(10):
+                sheet.load(extra_context={"prefix": number})
+                results.append((sheet.rows(), sheet.errors))
+            return number, language, results
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            outcomes = list(executor.map(load, range(8)))
+
+        for number, language, results in outcomes:
+            for rows, errors in results:
+                self.assertEqual(rows[0]["artist"], f"{number}:David Bowie")
+                if language == DE:
+                    self.assertEqual(errors[0], "Zeile 7: „Album“ muss ausgefüllt sein")
+                else:
+                    self.assertEqual(errors[0], "Row 7: “Album” is required")
+
+    def test_load_many_threads(self):
+        results = load_many(
+            [(AlbumSheet, file_path("albums.xlsx"))] * 16,
+            max_workers=4,
+            executor_class=ThreadPoolExecutor,
+            extra_context={"prefix": "x"},
+        )
+
+        self.assertTrue(
+            all(result.rows[0]["artist"] == "x:David Bowie" for result in results)
+        )
@@ -0,0 +1,77 @@
+import os
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from superspreader import documents, fields
+from superspreader.documents import BaseDocument
+from superspreader.sheets import BaseSheet
+
+
+def file_path(file_name):
+    tests_dir = Path(__file__).parent.absolute()
+    path = os.path.join(tests_dir, "spreadsheets", file_name)
+    return path
+
+
+class AlbumSheet(BaseSheet):
+    sheet_name = "Albums"
+    header_rows = 3
+    label_row = 2
+
+    artist = fields.CharField(source="Artist")
+    album = fields.CharField(source="Album")
+
+
+class ArtistSheet(BaseSheet):
+    sheet_name = "Albums"
+    header_rows = 3
+    label_row = 2
+
+    artist = fields.CharField(source="Artist")
+
+
+class MissingSheet(BaseSheet):
+    sheet_name = "Missing"
+
+    name = fields.CharField(source="Name")
+
+
+class AlbumDocument(BaseDocument):
+    albums = AlbumSheet
+    artists = ArtistSheet
+
+
+class DocumentTestCase(unittest.TestCase):
+    def test_load(self):
+        document = AlbumDocument(file_path("albums.xlsx"))
+        document.load()
+
+        self.assertFalse(document.has_errors)
+        self.assertEqual(len(document.albums), 3)
+        self.assertEqual(document.artists[0], {"artist": "David Bowie"})
+        self.assertEqual(list(document.sheets.keys()), ["albums", "artists"])
+
+    def test_opened_once(self):
+        document = AlbumDocument(file_path("albums.xlsx"))
+
+        with patch.object(
+            documents, "load_workbook", wraps=documents.load_workbook
+        ) as load_workbook:
+            document.load(read_only=True)
+
+        load_workbook.assert_called_once()
+        self.assertEqual(len(document.artists), 3)
+
+    def test_missing_sheet(self):
+        class BrokenDocument(AlbumDocument):
+            missing = MissingSheet
+
+        document = BrokenDocument(file_path("albums.xlsx"))
+        document.load()
+
+        self.assertTrue(document.has_errors)
+        self.assertEqual(
+            document.errors, {"missing": ["Sheet “Missing” not present in document"]}
+        )
+        self.assertEqual(len(document.albums), 3)
@@ -0,0 +1,114 @@
+import io
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+from superspreader import exporters, fields
+from superspreader.exceptions import ImproperlyConfigured
+from superspreader.sheets import BaseSheet
+
+
+def file_path(file_name):
+    tests_dir = Path(__file__).parent.absolute()
+    path = os.path.join(tests_dir, "spreadsheets", file_name)
+    return path
+
+
+class AlbumSheet(BaseSheet):
+    sheet_name = "Albums"
+    header_rows = 3
+    label_row = 2
+
+    artist = fields.CharField(source="Artist")
+    album = fields.CharField(source="Album")
+    release_date = fields.DateField(source="Release Date")
+    average_review = fields.FloatField(source="Average Review")
+    chart_position = fields.IntegerField(source="Chart Position")
+
+
+class ExporterTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.sheet = AlbumSheet(file_path("albums_with_errors.xlsx"))
+
+    def test_json_lines(self):
+        fp = io.StringIO()
+        total = self.sheet.export(exporters.JSONLinesExporter(fp, chunk_size=2))
+        lines = [json.loads(line) for line in fp.getvalue().splitlines()]
+
+        self.assertEqual(total, 3)
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[0]["release_date"], "2022-01-07")
+        self.assertIsNone(lines[2]["album"])
+        # Errors are collected while exporting
+        self.assertEqual(self.sheet.errors, ["Row 7: “Album” is required"])
+        self.assertEqual(len(self.sheet), 0)
+
+    def test_csv(self):
+        fp = io.StringIO()
+        self.sheet.export(exporters.CSVExporter(fp))
+        lines = fp.getvalue().splitlines()
+
+        self.assertEqual(
+            lines[0], "artist,album,release_date,average_review,chart_position"
+        )
+        self.assertEqual(lines[1], "David Bowie,Toy,2022-01-07,4.3,5")
+        self.assertEqual(lines[3], "Kokoroko,,2022-08-01,4.7,30")
+
+    def test_sqlite(self):
+        connection = sqlite3.connect(":memory:")
+        self.sheet.export(
+            exporters.SQLiteExporter(connection, table="albums", chunk_size=2)
+        )
+
+        rows = connection.execute(
+            "SELECT artist, release_date, chart_position FROM albums"
+        ).fetchall()
+        self.assertEqual(rows[0], ("David Bowie", "2022-01-07", 5))
+        self.assertEqual(len(rows), 3)
+
+        column_types = {
+            name: type_
+            for _cid, name, type_, *_rest in connection.execute(
+                "PRAGMA table_info(albums)"
+            )
+        }
+        self.assertEqual(column_types["chart_position"], "INTEGER")
+        self.assertEqual(column_types["average_review"], "REAL")
+
+    def test_loaded_rows(self):
+        self.sheet.load()
+        fp = io.StringIO()
+        total = exporters.JSONLinesExporter(fp).export(
+            self.sheet.rows(exclude=["album"]), types=self.sheet.get_target_types()
+        )
+
+        self.assertEqual(total, 3)
+        self.assertNotIn("album", json.loads(fp.getvalue().splitlines()[0]))
+
+    @unittest.skipUnless(pyarrow, "pyarrow isn’t installed")
+    def test_parquet(self):
+        import pyarrow.parquet
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "albums.parquet")
+
+        self.sheet.export(exporters.ParquetExporter(path))
+        table = pyarrow.parquet.read_table(path)
+
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(str(table.schema.field("chart_position").type), "int64")
+
+    @unittest.skipIf(pyarrow, "pyarrow is installed")
+    def test_parquet_missing(self):
+        with self.assertRaises(ImproperlyConfigured):
+            self.sheet.export(exporters.ParquetExporter("albums.parquet"))
@@ -1,5 +1,8 @@
+import datetime
 import unittest
+from array import array
 
+from superspreader import fields
 from superspreader.exceptions import ValidationException
 from superspreader.fields import BaseField, TimecodeField
 
@@ -46,3 +49,91 @@ class BaseFieldTestCase(unittest.TestCase):
             test_field(invalid_timecode_str, language="en")
 
         self.assertEqual(cm.exception.msg, "“test” has an invalid format: asdf123")
+
+    def test_timecode_fraction(self):
+        test_field = TimecodeField(source="test")
+
+        self.assertEqual(test_field("00:00:01.25", language="en"), 1.25)
+        self.assertEqual(test_field(" 100:00:00-040 ", language="en"), 360000.04)
+
+    def test_date_field_text(self):
+        test_field = fields.DateField(source="test")
+        expected = datetime.date(2022, 1, 7)
+
+        self.assertEqual(test_field("2022-01-07", language="en"), expected)
+        self.assertEqual(test_field("2022-01-07T18:30:00Z", language="en"), expected)
+        self.assertEqual(test_field("07.01.2022", language="en"), expected)
+        # Excel serial numbers
+        self.assertEqual(test_field(44568, language="en"), expected)
+        self.assertEqual(test_field("44568", language="en"), expected)
+        # Excel treats 1900 as a leap year, like the Excel readers do
+        self.assertEqual(test_field(1, language="en"), datetime.date(1900, 1, 1))
+        self.assertEqual(test_field(59, language="en"), datetime.date(1900, 2, 28))
+        self.assertEqual(test_field(61, language="en"), datetime.date(1900, 3, 1))
+        with self.assertRaises(ValidationException):
+            test_field(0.5, language="en")
+
+        with self.assertRaises(ValidationException) as cm:
+            test_field("Friday", language="en")
+        self.assertEqual(cm.exception.msg, "“test” has an invalid date: Friday")
+
+    def test_date_field_formats(self):
+        test_field = fields.DateField(source="test", formats=["%Y-%j", "%m/%d/%Y"])
+        context = fields.FieldContext()
+
+        self.assertEqual(
+            test_field.clean("01/07/2022", context), datetime.date(2022, 1, 7)
+        )
+        # The matching format is remembered for the load
+        self.assertEqual(context.get_cache(test_field), {"format": "%m/%d/%Y"})
+        self.assertEqual(
+            test_field.clean("2022-100", context), datetime.date(2022, 4, 10)
+        )
+
+        with self.assertRaises(ValidationException):
+            # Not in the formats
+            test_field.clean("07.01.2022", context)
+
+    def test_date_time_field_text(self):
+        test_field = fields.DateTimeField(source="test")
+
+        self.assertEqual(
+            test_field("2022-01-07 18:30", language="en"),
+            datetime.datetime(2022, 1, 7, 18, 30),
+        )
+        self.assertEqual(
+            test_field("07.01.2022 18:30", language="en"),
+            datetime.datetime(2022, 1, 7, 18, 30),
+        )
+        self.assertEqual(
+            test_field(44568.75, language="en"), datetime.datetime(2022, 1, 7, 18)
+        )
+
+    def test_clean_column(self):
+        test_field = fields.FloatField(source="test")
+        cleaned, errors = test_field.clean_column([1.5, 2, 3.25])
+
+        self.assertIsInstance(cleaned, array)
+        self.assertEqual(list(cleaned), [1.5, 2.0, 3.25])
+        self.assertEqual(errors, [])
+
+    def test_clean_column_errors(self):
+        test_field = fields.IntegerField(source="test")
+        cleaned, errors = test_field.clean_column([1, "2", None, "x"])
+
+        self.assertEqual(cleaned, [1, 2, None, None])
+        self.assertEqual(
+            [(offset, str(error)) for offset, error in errors],
+            [
+                (2, "“test” is required"),
+                (3, "“test” should be of type int, but it’s of type str"),
+            ],
+        )
+        self.assertEqual(errors[0][1].code, "field.is_required")
+
+    def test_clean_column_default(self):
+        test_field = fields.IntegerField(source="test", default=0)
+        cleaned, errors = test_field.clean_column([1, None])
+
+        self.assertEqual(list(cleaned), [1, 0])
+        self.assertEqual(errors, [])
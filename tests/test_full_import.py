@@ -6,9 +6,17 @@ import datetime
 import os
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from superspreader import fields
+from superspreader.exceptions import ValidationException
+from superspreader.i18n import DE
+from superspreader.readers import OpenpyxlReader
 from superspreader.sheets import BaseSheet
 
 
@@ -30,6 +38,17 @@ class AlbumSheet(BaseSheet):
     chart_position = fields.IntegerField(source="Chart Position")
 
 
+class ReviewSheet(BaseSheet):
+    sheet_name = "Albums"
+    header_rows = 3
+    label_row = 2
+
+    artist = fields.CharField(source="Artist")
+    album = fields.CharField(source="Album")
+    average_review = fields.FloatField(source="Average Review")
+    chart_position = fields.IntegerField(source="Chart Position")
+
+
 class TestFullImport(unittest.TestCase):
     """
     Test the process of importing a spreadsheet
@@ -59,6 +78,47 @@ class TestFullImport(unittest.TestCase):
         with self.assertRaises(KeyError):
             rows[0]["album"]
 
+        # Excluding doesn’t change the rows of the sheet
+        self.assertEqual(self.sheet[0]["album"], "Toy")
+        self.assertNotIn("album", self.sheet.rows(exclude=["album", "album"])[0])
+
+    def test_rows_projection(self):
+        self.sheet.load()
+        rows = self.sheet.rows(include=["artist", "album"], rename={"album": "title"})
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0], {"artist": "David Bowie", "title": "Toy"})
+        with self.assertRaises(KeyError):
+            rows[0]["album"]
+        with self.assertRaises(TypeError):
+            rows[0]["artist"] = "Bowie"
+
+    def test_rows_rename_collision(self):
+        self.sheet.load()
+        for kwargs in (
+            {"rename": {"album": "artist"}},
+            {"rename": {"album": "title", "artist": "title"}},
+            {"include": ["artist", "album"], "rename": {"album": "artist"}},
+        ):
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    self.sheet.rows(**kwargs)
+
+        # Keys that are renamed or left out don’t collide
+        rows = self.sheet.rows(rename={"album": "artist", "artist": "album"})
+        self.assertEqual(rows[0]["artist"], "Toy")
+        rows = self.sheet.rows(exclude=["artist"], rename={"album": "artist"})
+        self.assertEqual(rows[0]["artist"], "Toy")
+
+    def test_rows_copy(self):
+        self.sheet.load()
+        rows = self.sheet.rows(exclude=["album"], copy=True)
+
+        self.assertIsInstance(rows[0], dict)
+        rows[0]["artist"] = "Bowie"
+        self.assertEqual(self.sheet[0]["artist"], "David Bowie")
+        self.assertNotIn("album", rows[0])
+
     def test_info(self):
         self.sheet.load()
         self.assertEqual("Row 6: Skipped row", self.sheet.infos[0])
@@ -71,6 +131,322 @@ class TestFullImport(unittest.TestCase):
         self.assertTrue(sheet_with_errors.has_errors)
         self.assertEqual(sheet_with_errors.errors[0], "Row 7: “Album” is required")
 
+    def test_read_only(self):
+        """Tests whether streaming a sheet yields the same result"""
+        self.sheet.load()
+        sheet = AlbumSheet(file_path("albums.xlsx"))
+        sheet.load(read_only=True)
+
+        self.assertEqual(sheet.rows(), self.sheet.rows())
+        self.assertEqual(sheet.infos, self.sheet.infos)
+
+    def test_read_only_attribute(self):
+        class ReadOnlyAlbumSheet(AlbumSheet):
+            read_only = True
+
+        sheet = ReadOnlyAlbumSheet(file_path("albums_with_errors.xlsx"))
+        sheet.load()
+        self.assertEqual(sheet.errors[0], "Row 7: “Album” is required")
+
+    def test_iter_load(self):
+        """Tests whether rows are yielded without being kept on the sheet"""
+        rows = [row for row, errors in self.sheet.iter_load()]
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0].get("album"), "Toy")
+        self.assertEqual(len(self.sheet), 0)
+
+    def test_iter_load_errors(self):
+        sheet = AlbumSheet(file_path("albums_with_errors.xlsx"))
+        row_errors = [errors for row, errors in sheet.iter_load() if errors]
+
+        self.assertEqual(
+            [str(error) for error in row_errors[0]], ["Row 7: “Album” is required"]
+        )
+        self.assertEqual(sheet.errors[0], "Row 7: “Album” is required")
+
+    def test_error_records(self):
+        sheet = AlbumSheet(file_path("albums_with_errors.xlsx"))
+        sheet.load()
+        record = sheet.error_records[0]
+
+        self.assertEqual(record.code, "field.is_required")
+        self.assertEqual(record.row, 7)
+        self.assertEqual(record.column, "Album")
+        self.assertEqual(record.format(DE), "Zeile 7: „Album“ muss ausgefüllt sein")
+
+        # Changing the language formats the same records differently
+        sheet.language = DE
+        self.assertEqual(sheet.errors[0], "Zeile 7: „Album“ muss ausgefüllt sein")
+
+    def test_error_summary(self):
+        sheet = AlbumSheet(file_path("albums_with_errors.xlsx"))
+        sheet.load()
+
+        self.assertEqual(
+            sheet.error_summary()[0], "is_required in column “Album”: 1 rows"
+        )
+
+    def test_revalidate(self):
+        sheet = AlbumSheet(file_path("albums_with_errors.xlsx"))
+        sheet.load()
+        self.assertEqual(sheet.errors, ["Row 7: “Album” is required"])
+
+        # Row 7 is the fourth row after the header rows
+        self.assertFalse(sheet.revalidate({3: {"Chart Position": "x"}}))
+        self.assertEqual(
+            sheet.errors,
+            [
+                "Row 7: “Album” is required",
+                "Row 7: “Chart Position” should be of type int, but it’s of type str",
+            ],
+        )
+
+        self.assertTrue(
+            sheet.revalidate({3: {"Album": "Could We Be More", "Chart Position": 3}})
+        )
+        self.assertEqual(sheet.rows()[2]["album"], "Could We Be More")
+        self.assertEqual(sheet.rows()[2]["chart_position"], 3)
+
+        with self.assertRaises(KeyError):
+            # Row 6 is blank and has been skipped
+            sheet.revalidate({2: {"Album": "Toy"}})
+
+    def test_compact_rows(self):
+        self.sheet.load()
+        sheet = AlbumSheet(file_path("albums.xlsx"), extra_data={"status": "released"})
+        sheet.compact_rows = True
+        sheet.load()
+
+        self.assertIsInstance(sheet._rows[0], tuple)
+        self.assertEqual(sheet[0], {**self.sheet[0], "status": "released"})
+        self.assertEqual(
+            [row["album"] for row in sheet],
+            ["Toy", "Fix Yourself, Not The World", "Could We Be More"],
+        )
+        self.assertNotIn("album", sheet.rows(exclude=["album"])[0])
+        self.assertEqual(sheet[0]["album"], "Toy")
+
+        sheet.revalidate({0: {"Album": "Blackstar"}})
+        self.assertEqual(sheet[0]["album"], "Blackstar")
+        self.assertEqual(sheet[0]["status"], "released")
+
+    def test_blank_tail(self):
+        """Tests whether reading stops in the formatted, but empty tail of a sheet"""
+        sheet = AlbumSheet(file_path("albums_blank_tail.xlsx"))
+        sheet.blank_row_threshold = 100
+        sheet.load(read_only=True)
+
+        self.assertEqual(len(sheet.rows()), 3)
+        self.assertEqual(
+            sheet.infos,
+            [
+                "Row 6: Skipped row",
+                "Rows 8–107: Skipped row",
+                "Stopped reading after 100 blank rows",
+            ],
+        )
+
+    def test_blank_tail_disabled(self):
+        sheet = AlbumSheet(file_path("albums_blank_tail.xlsx"))
+        sheet.blank_row_threshold = None
+        sheet.load()
+
+        self.assertEqual(len(sheet.rows()), 3)
+        self.assertEqual(
+            sheet.infos, ["Row 6: Skipped row", "Rows 8–5000: Skipped row"]
+        )
+
+        columnar_sheet = AlbumSheet(file_path("albums_blank_tail.xlsx"))
+        columnar_sheet.load(columnar=True)
+        self.assertEqual(columnar_sheet.infos, sheet.infos)
+
+    def test_blank_tail_default(self):
+        """Tests whether blank rows, that aren’t skipped, don’t stop reading"""
+
+        class DefaultSheet(BaseSheet):
+            sheet_name = "Albums"
+            header_rows = 3
+            label_row = 2
+            blank_row_threshold = 100
+
+            album = fields.CharField(source="Album", default="Unknown")
+
+        sheet = DefaultSheet(file_path("albums_blank_tail.xlsx"))
+        sheet.load()
+
+        self.assertEqual(len(sheet), 4997)
+        self.assertEqual(sheet[len(sheet) - 1]["album"], "Unknown")
+        self.assertEqual(sheet.infos, [])
+
+        # Reading all rows is the default
+        sheet = AlbumSheet(file_path("albums_blank_tail.xlsx"))
+        sheet.load()
+        self.assertEqual(sheet.infos[-1], "Rows 8–5000: Skipped row")
+
+    def test_columnar(self):
+        """Tests whether a columnar load yields the same rows"""
+        self.sheet.load()
+        sheet = AlbumSheet(file_path("albums.xlsx"))
+        sheet.load(columnar=True)
+
+        self.assertEqual(sheet.rows(), self.sheet.rows())
+        self.assertEqual(sheet.infos, self.sheet.infos)
+
+        columns = sheet.columns()
+        self.assertEqual(columns["album"][0], "Toy")
+        self.assertEqual(len(columns["average_review"]), 3)
+        self.assertEqual(columns["average_review"][0], 4.3)
+
+    def test_columnar_errors(self):
+        path = file_path("albums_with_errors.xlsx")
+        sheet = AlbumSheet(path)
+        sheet.load()
+        columnar_sheet = AlbumSheet(path)
+        columnar_sheet.load(columnar=True)
+
+        self.assertEqual(columnar_sheet.errors, sheet.errors)
+
+    @unittest.skipUnless(numpy, "NumPy isn’t installed")
+    def test_columnar_numpy(self):
+        self.sheet.load(columnar=True)
+        columns = self.sheet.columns(as_numpy=True)
+
+        self.assertEqual(columns["chart_position"].dtype, numpy.int64)
+        self.assertEqual(columns["release_date"][0], numpy.datetime64("2022-01-07"))
+
+    def test_csv(self):
+        """Tests whether CSV and TSV files are loaded like Excel documents"""
+        sheet = ReviewSheet(file_path("albums.xlsx"))
+        sheet.load()
+
+        for file_name in ("albums.csv", "albums.tsv"):
+            with self.subTest(file_name=file_name):
+                text_sheet = ReviewSheet(file_path(file_name))
+                text_sheet.load()
+
+                self.assertFalse(text_sheet.has_errors)
+                self.assertEqual(text_sheet.rows(), sheet.rows())
+                self.assertEqual(text_sheet.infos, ["Row 6: Skipped row"])
+
+    def test_column_span(self):
+        """Tests whether only the columns used by fields are read"""
+        self.sheet.load()
+        sheet = AlbumSheet(file_path("albums_wide.xlsx"))
+
+        with patch.object(
+            OpenpyxlReader,
+            "iter_rows",
+            autospec=True,
+            side_effect=OpenpyxlReader.iter_rows,
+        ) as iter_rows:
+            sheet.load(read_only=True)
+
+        self.assertEqual(sheet.rows(), self.sheet.rows())
+        self.assertEqual(sheet.infos, self.sheet.infos)
+        kwargs = iter_rows.call_args[1]
+        self.assertEqual((kwargs["min_col"], kwargs["max_col"]), (4, 8))
+
+    def test_csv_dates(self):
+        """Tests whether dates stored as text are parsed"""
+        self.sheet.load()
+
+        for columnar in (False, True):
+            with self.subTest(columnar=columnar):
+                sheet = AlbumSheet(file_path("albums.csv"))
+                sheet.load(columnar=columnar)
+                self.assertEqual(sheet.rows(), self.sheet.rows())
+
+    def test_column_span_csv(self):
+        class ChartSheet(BaseSheet):
+            sheet_name = "Albums"
+            header_rows = 3
+            label_row = 2
+
+            album = fields.CharField(source="Album")
+            average_review = fields.FloatField(source="Average Review")
+
+        sheet = ChartSheet(file_path("albums.csv"))
+        sheet.load()
+        self.assertEqual(sheet[0], {"album": "Toy", "average_review": 4.3})
+
+    def test_csv_column_missing(self):
+        class LabelSheet(ReviewSheet):
+            label = fields.CharField(source="Label")
+
+        sheet = LabelSheet(file_path("albums.csv"))
+        sheet.load()
+        self.assertEqual(sheet.errors, ["Column “Label” not present in sheet"])
+
+    def test_max_errors(self):
+        class BudgetAlbumSheet(AlbumSheet):
+            max_errors = 5
+
+        sheet = BudgetAlbumSheet(file_path("albums_shifted.xlsx"))
+        sheet.load()
+
+        self.assertEqual(len(sheet), 5)
+        self.assertEqual(len(sheet.errors), 6)
+        self.assertEqual(sheet.errors[-1], "Row 8: Too many errors, stopped loading")
+
+    def test_max_consecutive_error_rows(self):
+        class BudgetAlbumSheet(AlbumSheet):
+            max_consecutive_error_rows = 11
+
+        sheet = BudgetAlbumSheet(file_path("albums_shifted.xlsx"))
+        sheet.load()
+
+        # The valid row in between resets the count
+        self.assertEqual(len(sheet), 21)
+        self.assertFalse(any("Too many errors" in error for error in sheet.errors))
+
+        BudgetAlbumSheet.max_consecutive_error_rows = 3
+        sheet.load()
+        self.assertEqual(len(sheet), 3)
+        self.assertEqual(sheet.errors[-1], "Row 6: Too many errors, stopped loading")
+
+    def test_legacy_clean(self):
+        """Tests whether fields, whose `clean` doesn’t accept a context, still work"""
+        with self.assertWarns(DeprecationWarning):
+
+            class ChartField(fields.IntegerField):
+                def clean(self, value):
+                    if value == 30:
+                        raise ValidationException("Not in the top 20")
+                    return super().clean(value)
+
+        class ChartSheet(BaseSheet):
+            sheet_name = "Albums"
+            header_rows = 3
+            label_row = 2
+
+            artist = fields.CharField(source="Artist")
+            chart_position = ChartField(source="Chart Position")
+
+        for columnar in (False, True):
+            with self.subTest(columnar=columnar):
+                sheet = ChartSheet(file_path("albums.xlsx"))
+                sheet.load(columnar=columnar)
+
+                self.assertEqual(sheet[0]["chart_position"], 5)
+                self.assertEqual(sheet.errors, ["Row 7: Not in the top 20"])
+
+    def test_validate(self):
+        self.assertTrue(self.sheet.validate())
+        self.assertEqual(len(self.sheet), 0)
+
+        sheet = AlbumSheet(file_path("albums_shifted.xlsx"))
+        self.assertFalse(sheet.validate(sample_size=2))
+        self.assertEqual(len(sheet.errors), 2)
+
+    def test_validate_structure(self):
+        class LabelSheet(AlbumSheet):
+            label = fields.CharField(source="Label")
+
+        sheet = LabelSheet(file_path("albums.xlsx"))
+        self.assertFalse(sheet.validate(sample_size=0))
+        self.assertEqual(sheet.errors, ["Column “Label” not present in sheet"])
+
     def test_empty_sheet_with_extra_data(self):
         """Tests whether empty rows are skipped, even when extra data is provided"""
         path = file_path("albums_empty.xlsx")
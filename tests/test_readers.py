@@ -0,0 +1,156 @@
+import datetime
+import glob
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from superspreader import fields, readers
+from superspreader.readers import OpenpyxlReader, XLSXReader
+from superspreader.sheets import BaseSheet
+
+
+def file_path(file_name):
+    tests_dir = Path(__file__).parent.absolute()
+    path = os.path.join(tests_dir, "spreadsheets", file_name)
+    return path
+
+
+def read(reader_class, path, sheet_name, **kwargs):
+    reader = reader_class(path, **kwargs)
+    reader.open(sheet_name)
+    try:
+        return list(reader.iter_rows())
+    finally:
+        reader.close()
+
+
+def trimmed(rows):
+    """
+    Strips trailing empty cells and rows, as openpyxl pads rows differently
+    depending on its mode
+    """
+    rows = [tuple(row[: _used(row)]) for row in rows]
+    while rows and not rows[-1]:
+        rows.pop()
+    return rows
+
+
+def _used(row):
+    used = len(row)
+    while used and row[used - 1] is None:
+        used -= 1
+    return used
+
+
+class AlbumSheet(BaseSheet):
+    sheet_name = "Albums"
+    header_rows = 3
+    label_row = 2
+    reader_class = XLSXReader
+
+    artist = fields.CharField(source="Artist")
+    album = fields.CharField(source="Album")
+    release_date = fields.DateField(source="Release Date")
+    average_review = fields.FloatField(source="Average Review")
+    chart_position = fields.IntegerField(source="Chart Position")
+
+
+class XLSXReaderTestCase(unittest.TestCase):
+    def test_same_rows_as_openpyxl(self):
+        for path in glob.glob(file_path("albums*.xlsx")):
+            for kwargs in (
+                {},
+                {"min_row": 3, "max_row": 5},
+                {"min_col": 2, "max_col": 3},
+            ):
+                with self.subTest(path=path, **kwargs):
+                    reader = XLSXReader(path)
+                    reader.open("Albums")
+                    rows = list(reader.iter_rows(**kwargs))
+                    reader.close()
+
+                    expected = OpenpyxlReader(path, read_only=True)
+                    expected.open("Albums")
+                    self.assertEqual(rows, list(expected.iter_rows(**kwargs)))
+                    expected.close()
+
+    def test_types(self):
+        rows = read(XLSXReader, file_path("types.xlsx"), "Types")
+
+        self.assertEqual(
+            rows[1],
+            (
+                "Toy",
+                5,
+                4.3,
+                True,
+                datetime.datetime(2022, 1, 7),
+                datetime.datetime(2022, 1, 7, 13, 30),
+                datetime.time(1, 2, 3),
+                datetime.timedelta(hours=26, minutes=3),
+                # Formulas without a cached value
+                None,
+            ),
+        )
+        self.assertEqual(rows[2][4], datetime.datetime(1900, 1, 1))
+        # Missing rows are read as empty rows
+        self.assertEqual(rows[3], (None,) * 9)
+        self.assertEqual(rows[4], (None, None, "Sparse") + (None,) * 6)
+        self.assertEqual(
+            trimmed(rows),
+            trimmed(read(OpenpyxlReader, file_path("types.xlsx"), "Types")),
+        )
+
+    def test_date1904(self):
+        rows = read(XLSXReader, file_path("types_1904.xlsx"), "Types")
+
+        self.assertEqual(rows[1][4], datetime.datetime(2022, 1, 7))
+        self.assertEqual(rows[2][5], datetime.datetime(1999, 12, 31, 23, 59, 59))
+        self.assertEqual(
+            trimmed(rows),
+            trimmed(read(OpenpyxlReader, file_path("types_1904.xlsx"), "Types")),
+        )
+
+    def test_interned_strings(self):
+        rows = read(XLSXReader, file_path("albums.xlsx"), "Albums")
+        self.assertIs(rows[1][0], sys.intern("Artist"))
+
+    def test_missing_sheet(self):
+        reader = XLSXReader(file_path("albums.xlsx"))
+        with self.assertRaises(KeyError):
+            reader.open("Missing")
+        reader.close()
+
+    def test_fallback(self):
+        with patch.object(
+            XLSXReader,
+            "_XLSXReader__open_archive",
+            side_effect=readers._UnsupportedDocument,
+        ):
+            reader = XLSXReader(file_path("albums.xlsx"))
+            reader.open("Albums")
+
+        self.assertIsInstance(reader._fallback, OpenpyxlReader)
+        self.assertEqual(
+            list(reader.iter_rows(min_row=4, max_row=4)),
+            [("David Bowie", "Toy", datetime.datetime(2022, 1, 7), 4.3, 5)],
+        )
+        reader.close()
+
+    def test_load(self):
+        sheet = AlbumSheet(file_path("albums_with_errors.xlsx"))
+        sheet.load()
+
+        self.assertEqual(len(sheet), 3)
+        self.assertEqual(sheet[0]["release_date"], datetime.date(2022, 1, 7))
+        self.assertEqual(sheet.errors, ["Row 7: “Album” is required"])
+
+    def test_load_missing_sheet(self):
+        class MissingSheet(AlbumSheet):
+            sheet_name = "Missing"
+
+        sheet = MissingSheet(file_path("albums.xlsx"))
+        sheet.load()
+        self.assertEqual(len(sheet.errors), 1)
@@ -0,0 +1,140 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from superspreader import fields
+from superspreader.cache import ResultCache
+from superspreader.exceptions import ValidationException
+from superspreader.fields import FieldContext, RelatedField
+from superspreader.sheets import BaseSheet
+
+
+def file_path(file_name):
+    tests_dir = Path(__file__).parent.absolute()
+    path = os.path.join(tests_dir, "spreadsheets", file_name)
+    return path
+
+
+class ArtistLookup:
+    """
+    Looks up artists in an in-memory SQLite database and counts queries
+    """
+
+    def __init__(self, names):
+        self.queries = []
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.execute(
+            "CREATE TABLE artist (id INTEGER PRIMARY KEY, name TEXT)"
+        )
+        self.connection.executemany(
+            "INSERT INTO artist (name) VALUES (?)", [(name,) for name in names]
+        )
+
+    def __call__(self, names):
+        self.queries.append(names)
+        placeholders = ", ".join("?" for _ in names)
+        return self.connection.execute(
+            f"SELECT name, id FROM artist WHERE name IN ({placeholders})", names
+        ).fetchall()
+
+
+class RelatedFieldTestCase(unittest.TestCase):
+    def test_clean(self):
+        lookup = ArtistLookup(["David Bowie", "Kokoroko", "Kokoroko"])
+        field = RelatedField(source="Artist", lookup=lookup, chunk_size=2)
+        context = FieldContext()
+
+        field.prepare(
+            ["David Bowie", "Kokoroko", "David Bowie", "Nobody", None], context
+        )
+        self.assertEqual(lookup.queries, [["David Bowie", "Kokoroko"], ["Nobody"]])
+        self.assertEqual(field.clean("David Bowie", context), 1)
+
+        with self.assertRaises(ValidationException) as cm:
+            field.clean("Nobody", context)
+        self.assertEqual(
+            cm.exception.msg,
+            "Related object identified by Nobody on “Artist” does not exist",
+        )
+
+        with self.assertRaises(ValidationException) as cm:
+            field.clean("Kokoroko", context)
+        self.assertEqual(
+            cm.exception.msg,
+            "More than one related object identified by Kokoroko on “Artist”",
+        )
+
+    def test_call(self):
+        """Tests whether values that weren’t prepared are looked up on their own"""
+        lookup = ArtistLookup(["David Bowie"])
+        field = RelatedField(source="Artist", lookup=lookup)
+
+        self.assertEqual(field("David Bowie", language="en"), 1)
+        self.assertEqual(lookup.queries, [["David Bowie"]])
+
+    def test_sheet(self):
+        lookup = ArtistLookup(["David Bowie", "The Wombats"])
+
+        class AlbumSheet(BaseSheet):
+            sheet_name = "Albums"
+            header_rows = 3
+            label_row = 2
+
+            artist = RelatedField(source="Artist", lookup=lookup)
+            album = fields.CharField(source="Album")
+
+        sheet = AlbumSheet(file_path("albums.xlsx"))
+        sheet.load()
+
+        self.assertEqual(len(lookup.queries), 1)
+        self.assertEqual([row["artist"] for row in sheet], [1, 2, None])
+        self.assertEqual(
+            sheet.errors,
+            ["Row 7: Related object identified by Kokoroko on “Artist” does not exist"],
+        )
+
+    def test_sheet_batches(self):
+        lookup = ArtistLookup(["David Bowie", "The Wombats", "Kokoroko"])
+
+        class AlbumSheet(BaseSheet):
+            sheet_name = "Albums"
+            header_rows = 3
+            label_row = 2
+            batch_size = 2
+
+            artist = RelatedField(source="Artist", lookup=lookup)
+
+        sheet = AlbumSheet(file_path("albums.xlsx"))
+        sheet.load()
+
+        self.assertEqual(lookup.queries, [["David Bowie", "The Wombats"], ["Kokoroko"]])
+        self.assertEqual([row["artist"] for row in sheet], [1, 2, 3])
+        self.assertEqual(sheet.infos, ["Row 6: Skipped row"])
+
+    def test_sheet_not_cached(self):
+        """Tests whether looked up objects aren’t served from the result cache"""
+        lookup = ArtistLookup(["David Bowie", "The Wombats"])
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        class AlbumSheet(BaseSheet):
+            sheet_name = "Albums"
+            header_rows = 3
+            label_row = 2
+            result_cache = ResultCache(directory)
+
+            artist = RelatedField(source="Artist", lookup=lookup)
+            album = fields.CharField(source="Album")
+
+        sheet = AlbumSheet(file_path("albums.xlsx"))
+        sheet.load()
+        self.assertEqual([row["artist"] for row in sheet], [1, 2, None])
+
+        lookup.connection.execute("INSERT INTO artist (name) VALUES ('Kokoroko')")
+        sheet = AlbumSheet(file_path("albums.xlsx"))
+        sheet.load()
+        self.assertEqual([row["artist"] for row in sheet], [1, 2, 3])
+        self.assertEqual(sheet.errors, [])
@@ -59,6 +59,36 @@ class SheetTestCase(unittest.TestCase):
 
         self.assertTrue("a_field" in sheet_fields)
 
+    def test_compile_fields(self):
+        """
+        Tests whether fields are compiled once, in field order
+        """
+        sheet = ContactSheet(path="test")
+        plan = sheet._compile_fields({"Name": 0, "ID": 1})
+
+        self.assertEqual([entry[0] for entry in plan], ["id", "name"])
+        self.assertEqual([entry[1] for entry in plan], [1, 0])
+        # CharField doesn’t override `clean`, so strings are taken as they are
+        self.assertIs(plan[0][3], str)
+
+    def test_compile_fields_custom_clean(self):
+        class UpperField(fields.CharField):
+            def clean(self, value, context=None):
+                return super().clean(value, context).upper()
+
+        class UpperSheet(BaseSheet):
+            sheet_name = "Upper"
+            name = UpperField(source="Name", default="n/a")
+
+        sheet = UpperSheet(path="test")
+        name, index, clean, exact_type, default, field = sheet._compile_fields(
+            {"Name": 0}
+        )[0]
+
+        self.assertIsNone(exact_type)
+        self.assertEqual(default, "n/a")
+        self.assertEqual(clean("abc"), "ABC")
+
     def test_unique_violation(self):
         """
         Tests whether unique fields are validate properly
@@ -70,5 +100,81 @@ class SheetTestCase(unittest.TestCase):
         self.assertEqual(len(sheet.errors), 1)
         self.assertEqual(
             sheet.errors[0],
-            "“ID” must contain unique values only, but “1” occurs 2 times",
+            "“ID” must contain unique values only, but “1” occurs 2 times (rows 2, 3)",
+        )
+
+    def test_unique_together_violation(self):
+        class NameSheet(BaseSheet):
+            sheet_name = "Contacts"
+            unique_together = (("first_name", "last_name"),)
+
+            first_name = fields.CharField(source="First name")
+            last_name = fields.CharField(source="Last name")
+
+        sheet = NameSheet(file_path("contacts_composite_duplicates.xlsx"))
+        sheet.load()
+
+        self.assertEqual(
+            sheet.errors,
+            [
+                "“First name, Last name” must be unique together, but “Ada, Lovelace”"
+                " occurs 2 times (rows 2, 4)"
+            ],
         )
+
+    def test_revalidate_unique(self):
+        for compact_rows in (False, True):
+            with self.subTest(compact_rows=compact_rows):
+                sheet = ContactSheet(file_path("contacts_duplicates.xlsx"))
+                sheet.compact_rows = compact_rows
+                sheet.load()
+
+                self.assertTrue(sheet.revalidate({1: {"ID": "2"}}))
+                self.assertEqual(sheet.rows()[1]["id"], "2")
+                self.assertEqual(sheet.errors, [])
+
+                self.assertFalse(sheet.revalidate({1: {"ID": 1}}))
+                self.assertEqual(
+                    sheet.errors,
+                    [
+                        "“ID” must contain unique values only, but “1” occurs 2 times (rows 2, 3)"
+                    ],
+                )
+
+    def test_validate_unique(self):
+        """Tests whether unique fields are validated, if all rows fit into the sample"""
+        sheet = ContactSheet(file_path("contacts_duplicates.xlsx"))
+        self.assertFalse(sheet.validate(sample_size=2))
+        self.assertEqual(
+            sheet.errors,
+            [
+                "“ID” must contain unique values only, but “1” occurs 2 times (rows 2, 3)"
+            ],
+        )
+
+        # There are more rows than the sample
+        sheet = ContactSheet(file_path("contacts_duplicates.xlsx"))
+        self.assertTrue(sheet.validate(sample_size=1))
+
+    def test_unique_together_unknown_field(self):
+        class NameSheet(BaseSheet):
+            sheet_name = "Contacts"
+            unique_together = (("first_name", "city"),)
+
+            first_name = fields.CharField(source="First name")
+
+        with self.assertRaises(ImproperlyConfigured):
+            NameSheet(path="test")
+
+    def test_unique_violation_iter_load(self):
+        """
+        Tests whether unique violations are reported once all rows are yielded
+        """
+        path = file_path("contacts_duplicates.xlsx")
+        sheet = ContactSheet(path)
+        rows = sheet.iter_load()
+        next(rows)
+        self.assertFalse(sheet.has_errors)
+
+        list(rows)
+        self.assertEqual(len(sheet.errors), 1)
@@ -0,0 +1,77 @@
+import os
+import unittest
+from pathlib import Path
+
+from superspreader import fields
+from superspreader.sheets import BaseSheet
+from superspreader.stats import LoadStats
+
+
+def file_path(file_name):
+    tests_dir = Path(__file__).parent.absolute()
+    path = os.path.join(tests_dir, "spreadsheets", file_name)
+    return path
+
+
+class AlbumSheet(BaseSheet):
+    sheet_name = "Albums"
+    header_rows = 3
+    label_row = 2
+
+    artist = fields.CharField(source="Artist", unique=True)
+    album = fields.CharField(source="Album")
+    release_date = fields.DateField(source="Release Date")
+
+
+class LoadStatsTestCase(unittest.TestCase):
+    def test_profile(self):
+        class ProfiledAlbumSheet(AlbumSheet):
+            profile = True
+
+        sheet = ProfiledAlbumSheet(file_path("albums.xlsx"))
+        self.assertIsNone(sheet.stats)
+        sheet.load(extra_context={}, read_only=True)
+
+        stats = sheet.stats
+        self.assertIsInstance(stats, LoadStats)
+        # Four rows including the blank one
+        self.assertEqual(stats.rows, 4)
+        self.assertGreater(stats.total, 0)
+        self.assertGreater(stats.rows_per_second, 0)
+        self.assertEqual(
+            set(stats.phases),
+            {"open", "column_map", "read", "clean", "extra_data", "unique"},
+        )
+        # Every field handles all rows that aren’t skipped as blank right away
+        self.assertEqual(stats.fields["artist"].values, 4)
+        self.assertEqual(stats.fields["release_date"].values, 4)
+        # Dates are converted by `clean`, strings are taken as they are
+        self.assertEqual(stats.fields["release_date"].calls, 3)
+        self.assertEqual(stats.fields["artist"].calls, 0)
+
+    def test_callbacks(self):
+        received = []
+        stats = LoadStats(callbacks=[received.append], trace_memory=True)
+
+        sheet = AlbumSheet(file_path("albums.xlsx"))
+        sheet.load(stats=stats)
+
+        self.assertEqual(received, [stats])
+        self.assertIs(sheet.stats, stats)
+        self.assertGreater(stats.peak_memory, 0)
+        self.assertEqual(stats.as_dict()["rows"], 4)
+
+    def test_columnar(self):
+        stats = LoadStats()
+        sheet = AlbumSheet(file_path("albums.xlsx"))
+        sheet.load(columnar=True, stats=stats)
+
+        # One call per column
+        self.assertEqual(stats.fields["artist"].calls, 1)
+        self.assertEqual(stats.fields["artist"].values, 4)
+        self.assertIn("unique", stats.phases)
+
+    def test_not_profiled(self):
+        sheet = AlbumSheet(file_path("albums.xlsx"))
+        sheet.load()
+        self.assertIsNone(sheet.stats)